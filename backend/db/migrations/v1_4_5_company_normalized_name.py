@@ -0,0 +1,114 @@
+"""
+Schema Migration v1.4.5
+
+Adds the normalized company name dedup key:
+- Adds normalized_name column to company_profiles
+- Backfills it from existing names using normalize_company_name
+- Creates ix_company_profiles_normalized_name
+- Backs up existing data before migration
+- Safe to run multiple times (idempotent)
+
+Usage:
+    cd backend
+    python -m db.migrations.v1_4_5_company_normalized_name
+"""
+
+import sqlite3
+import shutil
+from datetime import datetime
+from pathlib import Path
+
+from services.company_enrichment import normalize_company_name
+
+
+# Database path relative to backend directory
+DB_PATH = Path(__file__).parent.parent.parent / "etps.db"
+BACKUP_DIR = Path(__file__).parent / "backups"
+
+
+def backup_database():
+    """Create a timestamped backup of the database."""
+    BACKUP_DIR.mkdir(exist_ok=True)
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    backup_path = BACKUP_DIR / f"etps_backup_{timestamp}.db"
+
+    if DB_PATH.exists():
+        shutil.copy2(DB_PATH, backup_path)
+        print(f"Backup created: {backup_path}")
+        return backup_path
+    else:
+        print(f"No database found at {DB_PATH}, will create new")
+        return None
+
+
+def column_exists(cursor, table: str, column: str) -> bool:
+    """Check if a column exists in a table."""
+    cursor.execute(f"PRAGMA table_info({table})")
+    columns = [row[1] for row in cursor.fetchall()]
+    return column in columns
+
+
+def migrate_company_profiles_table(cursor):
+    """Add and backfill the normalized_name column."""
+    print("Migrating company_profiles table...")
+
+    if not column_exists(cursor, "company_profiles", "normalized_name"):
+        cursor.execute("ALTER TABLE company_profiles ADD COLUMN normalized_name VARCHAR(255)")
+        print("  Added column: normalized_name")
+    else:
+        print("  Column exists: normalized_name")
+
+    cursor.execute("SELECT id, name FROM company_profiles WHERE normalized_name IS NULL")
+    rows = cursor.fetchall()
+    cursor.executemany(
+        "UPDATE company_profiles SET normalized_name = ? WHERE id = ?",
+        [(normalize_company_name(name), row_id) for row_id, name in rows]
+    )
+    print(f"  Backfilled normalized_name for {len(rows)} profiles")
+
+
+def create_indexes(cursor):
+    """Create new indexes for v1.4.5 schema."""
+    print("Creating indexes...")
+
+    cursor.execute(
+        "CREATE INDEX IF NOT EXISTS ix_company_profiles_normalized_name "
+        "ON company_profiles(normalized_name)"
+    )
+    print("  Created index: ix_company_profiles_normalized_name")
+
+
+def run_migration():
+    """Execute the full migration."""
+    print("=" * 60)
+    print("ETPS Schema Migration v1.4.5")
+    print("=" * 60)
+
+    # Backup first
+    backup_path = backup_database()
+
+    # Connect to database
+    conn = sqlite3.connect(str(DB_PATH))
+    cursor = conn.cursor()
+
+    try:
+        migrate_company_profiles_table(cursor)
+        create_indexes(cursor)
+
+        # Commit all changes
+        conn.commit()
+        print("\n" + "=" * 60)
+        print("Migration completed successfully!")
+        print("=" * 60)
+
+    except Exception as e:
+        conn.rollback()
+        print(f"\nMigration failed: {e}")
+        print("Database rolled back. Backup available at:", backup_path)
+        raise
+    finally:
+        conn.close()
+
+
+if __name__ == "__main__":
+    run_migration()
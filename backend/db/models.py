@@ -241,6 +241,7 @@ class CompanyProfile(Base):
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
     name: Mapped[str] = mapped_column(String(255), unique=True, nullable=False, index=True)
+    normalized_name: Mapped[Optional[str]] = mapped_column(String(255))  # dedup key, see normalize_company_name
     website: Mapped[Optional[str]] = mapped_column(String(500))
     industry: Mapped[Optional[str]] = mapped_column(String(100))
     size_band: Mapped[Optional[str]] = mapped_column(String(50))  # "50-200", "1000-5000"
@@ -258,6 +259,10 @@ class CompanyProfile(Base):
     applications: Mapped[List["Application"]] = relationship("Application", back_populates="company")
     contacts: Mapped[List["Contact"]] = relationship("Contact", back_populates="company")
 
+    __table_args__ = (
+        Index("ix_company_profiles_normalized_name", "normalized_name"),
+    )
+
     def __repr__(self) -> str:
         return f"<CompanyProfile(id={self.id}, name='{self.name}', industry='{self.industry}')>"
 
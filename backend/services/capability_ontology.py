@@ -9,7 +9,11 @@ Each cluster contains:
 - Typical importance levels
 """
 
-from typing import Dict, List, Any
+import heapq
+import re
+import sys
+from dataclasses import dataclass
+from typing import Dict, FrozenSet, List, Any, Optional, Tuple
 
 
 # Capability Ontology: 25 clusters covering AI, Data, Consulting, Technical, and Leadership roles
@@ -603,9 +607,167 @@ CAPABILITY_ONTOLOGY: Dict[str, Dict[str, Any]] = {
 }
 
 
+# Freeze the per-cluster string lists into tuples of interned strings. The
+# ontology is never mutated at runtime; tuples of atomic strings are skipped
+# by the cyclic GC and shared keywords ("AI", "AWS", ...) become one object.
+for _data in CAPABILITY_ONTOLOGY.values():
+    for _field in ("component_skills", "evidence_keywords", "role_indicators"):
+        if _field in _data:
+            _data[_field] = tuple(sys.intern(v) for v in _data[_field])
+del _data, _field
+
+
+@dataclass(frozen=True, slots=True)
+class OntologyCluster:
+    """Immutable runtime view of one ontology cluster, shaped for lookups."""
+    name: str
+    description: str
+    component_skills: Tuple[str, ...]
+    evidence_keywords: Tuple[str, ...]
+    evidence_keywords_lower: FrozenSet[str]
+    role_indicators_lower: Tuple[str, ...]
+    typical_importance: str
+
+
+_IMPORTANCE_LEVELS = frozenset({"critical", "important", "nice-to-have"})
+_REQUIRED_LIST_FIELDS = ("component_skills", "evidence_keywords")
+
+
+def _build_cluster(name: str, data: Dict[str, Any]) -> OntologyCluster:
+    """
+    Validate one ontology entry and build its runtime view.
+
+    Raises:
+        ValueError: If the entry is missing fields or has malformed values
+    """
+    description = data.get("description")
+    if not isinstance(description, str) or not description:
+        raise ValueError(f"Capability cluster '{name}' has no description")
+    for field in _REQUIRED_LIST_FIELDS:
+        values = data.get(field)
+        if not values or not all(isinstance(v, str) and v for v in values):
+            raise ValueError(f"Capability cluster '{name}' has invalid {field}")
+    role_indicators = data.get("role_indicators", ())
+    if not all(isinstance(i, str) and i for i in role_indicators):
+        raise ValueError(f"Capability cluster '{name}' has invalid role_indicators")
+    importance = data.get("typical_importance", "important")
+    if importance not in _IMPORTANCE_LEVELS:
+        raise ValueError(f"Capability cluster '{name}' has unknown importance '{importance}'")
+
+    return OntologyCluster(
+        name=name,
+        description=description,
+        component_skills=tuple(data["component_skills"]),
+        evidence_keywords=tuple(data["evidence_keywords"]),
+        evidence_keywords_lower=frozenset(
+            sys.intern(k.lower()) for k in data["evidence_keywords"]
+        ),
+        role_indicators_lower=tuple(sys.intern(i.lower()) for i in role_indicators),
+        typical_importance=importance,
+    )
+
+
+# Validated and built once at import; the ontology is static, so lookups read
+# precomputed lowercase forms instead of probing and lowercasing the dicts
+# per query. Lowercase forms are interned too, so keywords shared across
+# clusters ("ai", "aws", ...) are a single object. Scoring itself only
+# touches the slim _CLUSTER_MASKS tuple below, not these views.
+_CLUSTERS: Tuple[OntologyCluster, ...] = tuple(
+    _build_cluster(name, data) for name, data in CAPABILITY_ONTOLOGY.items()
+)
+_CLUSTERS_BY_NAME: Dict[str, OntologyCluster] = {c.name: c for c in _CLUSTERS}
+
+# Keyword bitmaps: each distinct lowercased evidence keyword gets a bit, and
+# each cluster's evidence keywords are packed into one int. Overlap with a
+# query becomes a single AND + popcount per cluster instead of a set build.
+_KW_INDEX: Dict[str, int] = {
+    kw: bit
+    for bit, kw in enumerate(sorted({kw for c in _CLUSTERS for kw in c.evidence_keywords_lower}))
+}
+_CLUSTER_MASKS: Tuple[int, ...] = tuple(
+    sum(1 << _KW_INDEX[kw] for kw in c.evidence_keywords_lower)
+    for c in _CLUSTERS
+)
+
+# Longest evidence keyword in words; bounds the n-grams prepare_keyword_set emits
+_MAX_KEYWORD_WORDS: int = max(len(kw.split()) for kw in _KW_INDEX)
+_KEYWORD_TOKEN_PATTERN = re.compile(r"[a-z0-9+#]+(?:[./\-][a-z0-9+#]+)*")
+
+# Sorted unique evidence keywords (original casing) across all clusters
+_ALL_EVIDENCE_KEYWORDS: Tuple[str, ...] = tuple(sorted({
+    kw
+    for cluster in _CLUSTERS
+    for kw in cluster.evidence_keywords
+}))
+
+# Cluster names in ontology order
+_CLUSTER_NAMES: Tuple[str, ...] = tuple(CAPABILITY_ONTOLOGY)
+
+# Prompt summary text, one line per cluster with a truncated description
+_ONTOLOGY_SUMMARY: str = "\n".join(
+    ["Available Capability Clusters:"] + [
+        f"- {c.name} ({len(c.component_skills)} components): {c.description[:100]}..."
+        for c in _CLUSTERS
+    ]
+)
+
+
+def _is_word_char(char: str) -> bool:
+    return char.isalnum() or char == "_"
+
+
+def _contains_word(text: str, word: str) -> bool:
+    """
+    Check whether word occurs in text on word boundaries, like r"\bword\b".
+
+    Assumes word starts and ends with word characters (true for all role
+    indicators). Used at import instead of compiling one regex per indicator,
+    which dominated module load time.
+    """
+    start = text.find(word)
+    while start != -1:
+        end = start + len(word)
+        if (start == 0 or not _is_word_char(text[start - 1])) and \
+                (end == len(text) or not _is_word_char(text[end])):
+            return True
+        start = text.find(word, start + 1)
+    return False
+
+
+def _build_role_indicator_matcher() -> Tuple["re.Pattern[str]", Dict[str, Tuple[int, ...]]]:
+    """
+    Compile every role indicator into one word-bounded alternation.
+
+    The lookahead makes matches zero-width so overlapping indicators are all
+    visited, and longest-first ordering yields the longest indicator at each
+    position. Any shorter indicator matching at that position occurs as a
+    whole word inside it, so each indicator maps to the clusters of every
+    indicator it contains on word boundaries.
+    """
+    indicator_clusters: Dict[str, set] = {}
+    for idx, cluster in enumerate(_CLUSTERS):
+        for indicator in cluster.role_indicators_lower:
+            indicator_clusters.setdefault(indicator, set()).add(idx)
+
+    indicators = sorted(indicator_clusters, key=len, reverse=True)
+    cluster_map = {
+        indicator: tuple(sorted(
+            idx
+            for other in indicators if _contains_word(indicator, other)
+            for idx in indicator_clusters[other]
+        ))
+        for indicator in indicators
+    }
+    pattern = re.compile(r"(?=\b(" + "|".join(re.escape(i) for i in indicators) + r")\b)")
+    return pattern, cluster_map
+
+
+_ROLE_INDICATOR_PATTERN, _ROLE_INDICATOR_CLUSTERS = _build_role_indicator_matcher()
+
+
 def get_cluster_names() -> List[str]:
     """Return list of all capability cluster names."""
-    return list(CAPABILITY_ONTOLOGY.keys())
+    return list(_CLUSTER_NAMES)
 
 
 def get_cluster(name: str) -> Dict[str, Any]:
@@ -613,68 +775,122 @@ def get_cluster(name: str) -> Dict[str, Any]:
     return CAPABILITY_ONTOLOGY.get(name, {})
 
 
-def get_clusters_by_keywords(keywords: List[str]) -> List[str]:
+def get_cluster_evidence_keywords(name: str) -> FrozenSet[str]:
     """
-    Find clusters that match given keywords.
-    Returns cluster names sorted by match strength.
+    Get the lowercased evidence keywords for a cluster.
+    Returns an empty set for unknown clusters.
     """
-    keyword_set = {k.lower() for k in keywords}
-    matches = []
+    cluster = _CLUSTERS_BY_NAME.get(name)
+    return cluster.evidence_keywords_lower if cluster else frozenset()
+
 
-    for cluster_name, cluster_data in CAPABILITY_ONTOLOGY.items():
-        evidence_keywords = {k.lower() for k in cluster_data.get("evidence_keywords", [])}
-        overlap = keyword_set & evidence_keywords
-        if overlap:
-            matches.append((cluster_name, len(overlap)))
+def get_ontology_cluster(name: str) -> Optional[OntologyCluster]:
+    """Get the immutable runtime view of a cluster, or None if unknown."""
+    return _CLUSTERS_BY_NAME.get(name)
 
-    # Sort by match count descending
-    matches.sort(key=lambda x: x[1], reverse=True)
-    return [m[0] for m in matches]
+
+def _match_rank(match: Tuple[int, int]) -> Tuple[int, int]:
+    """Sort key for (cluster index, match count): count desc, then ontology order."""
+    return (-match[1], match[0])
+
+
+def prepare_keyword_set(text: str) -> FrozenSet[str]:
+    """
+    Tokenize text into a lowercased keyword set for repeated cluster lookups.
+
+    Emits single tokens plus word n-grams up to the longest evidence keyword,
+    so multi-word keywords like "machine learning" are found. Build this once
+    per document and pass it to get_clusters_by_keywords_fast().
+    """
+    tokens = _KEYWORD_TOKEN_PATTERN.findall(text.lower())
+    keyword_set = set(tokens)
+    for n in range(2, _MAX_KEYWORD_WORDS + 1):
+        keyword_set.update(" ".join(tokens[i:i + n]) for i in range(len(tokens) - n + 1))
+    return frozenset(keyword_set)
+
+
+def get_clusters_by_keywords_fast(
+    keyword_set: FrozenSet[str],
+    top_k: Optional[int] = None
+) -> List[str]:
+    """
+    Find clusters matching an already-lowercased keyword set.
+
+    Same ranking as get_clusters_by_keywords() but skips lowercasing the
+    input, so callers can reuse one prepare_keyword_set() result.
+    """
+    query_mask = 0
+    for keyword in keyword_set:
+        bit = _KW_INDEX.get(keyword)
+        if bit is not None:
+            query_mask |= 1 << bit
+
+    matches = [
+        (idx, (query_mask & mask).bit_count())
+        for idx, mask in enumerate(_CLUSTER_MASKS)
+        if query_mask & mask
+    ]
+
+    # Sort by match count descending, ties in ontology order
+    if top_k is not None:
+        matches = heapq.nsmallest(top_k, matches, key=_match_rank)
+    else:
+        matches.sort(key=_match_rank)
+    return [_CLUSTERS[idx].name for idx, _ in matches]
+
+
+def get_clusters_by_keywords(keywords: List[str], top_k: Optional[int] = None) -> List[str]:
+    """
+    Find clusters that match given keywords.
+    Returns cluster names sorted by match strength, ties in ontology order.
+
+    Args:
+        keywords: Keywords to match against cluster evidence keywords
+        top_k: If set, return only the top_k strongest matches
+    """
+    return get_clusters_by_keywords_fast(frozenset(k.lower() for k in keywords), top_k)
 
 
 def get_clusters_by_role_indicators(job_title: str) -> List[str]:
     """
     Find clusters that are typically relevant for a job title.
     Returns cluster names that have matching role indicators.
-    """
-    job_title_lower = job_title.lower()
-    matches = []
 
-    for cluster_name, cluster_data in CAPABILITY_ONTOLOGY.items():
-        indicators = cluster_data.get("role_indicators", [])
-        for indicator in indicators:
-            if indicator in job_title_lower:
-                matches.append(cluster_name)
-                break
+    Indicators match on word boundaries, so "lead" does not match "leadership".
+    """
+    matched = set()
+    for match in _ROLE_INDICATOR_PATTERN.finditer(job_title.lower()):
+        matched.update(_ROLE_INDICATOR_CLUSTERS[match.group(1)])
 
-    return matches
+    return [_CLUSTERS[idx].name for idx in sorted(matched)]
 
 
 def get_all_evidence_keywords() -> List[str]:
     """Return all unique evidence keywords from the ontology."""
-    keywords = set()
-    for cluster_data in CAPABILITY_ONTOLOGY.values():
-        keywords.update(cluster_data.get("evidence_keywords", []))
-    return sorted(keywords)
+    # Precomputed as a tuple; hand out a fresh list so callers can mutate it
+    return list(_ALL_EVIDENCE_KEYWORDS)
 
 
 def get_ontology_summary() -> str:
     """
     Get a text summary of the ontology for use in LLM prompts.
+
+    The ontology is static at runtime, so the summary is built once at import.
     """
-    lines = ["Available Capability Clusters:"]
-    for name, data in CAPABILITY_ONTOLOGY.items():
-        component_count = len(data.get("component_skills", []))
-        lines.append(f"- {name} ({component_count} components): {data['description'][:100]}...")
-    return "\n".join(lines)
+    return _ONTOLOGY_SUMMARY
 
 
 # Export for convenience
 __all__ = [
     "CAPABILITY_ONTOLOGY",
+    "OntologyCluster",
     "get_cluster_names",
     "get_cluster",
+    "get_cluster_evidence_keywords",
+    "get_ontology_cluster",
     "get_clusters_by_keywords",
+    "get_clusters_by_keywords_fast",
+    "prepare_keyword_set",
     "get_clusters_by_role_indicators",
     "get_all_evidence_keywords",
     "get_ontology_summary"
@@ -10,17 +10,28 @@ Security considerations:
 - Input validation: sanitizes all user inputs
 """
 
+import asyncio
+import hashlib
 import logging
+import os
 import re
 import socket
+import threading
+import time
+import weakref
 from datetime import datetime, timezone
+from functools import lru_cache
 from ipaddress import ip_address
-from typing import Dict, Any, List, Optional, Tuple
-from urllib.parse import urlparse
+from typing import Dict, Any, FrozenSet, List, Optional, Set, Tuple
+from urllib.parse import urljoin, urlparse
 from urllib.robotparser import RobotFileParser
 
 import requests
+import yaml
 from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from sqlalchemy import case, or_
 from sqlalchemy.orm import Session
 
 from db.models import CompanyProfile
@@ -28,14 +39,108 @@ from services.llm.mock_llm import MockLLM
 
 logger = logging.getLogger(__name__)
 
+# Prefer the C-based lxml parser; fall back to the pure-Python stdlib parser
+try:
+    import lxml  # noqa: F401
+    _HTML_PARSER = "lxml"
+except ImportError:
+    _HTML_PARSER = "html.parser"
+
 # Configuration defaults (can be overridden via config.yaml)
 DEFAULT_CONFIG = {
     "website_fetch_timeout": 10,
     "max_response_size": 50 * 1024,  # 50KB
     "user_agent": "ETPS/1.0 (Company Profile Enrichment)",
     "cache_duration_hours": 168,  # 1 week
+    "max_concurrent_fetches": 10,
+    "skip_about_if_homepage_chars": 1500,  # 0 = always try the about page
+    "force_refresh": False,  # bypass the fetched-website cache
 }
 
+
+def _load_config_overrides() -> Dict[str, Any]:
+    """Load the company_enrichment section of config.yaml (known keys only)."""
+    config_path = os.path.join(
+        os.path.dirname(__file__), '..', 'config', 'config.yaml'
+    )
+    try:
+        with open(config_path, 'r') as f:
+            section = (yaml.safe_load(f) or {}).get('company_enrichment') or {}
+    except FileNotFoundError:
+        return {}
+    return {key: value for key, value in section.items() if key in DEFAULT_CONFIG}
+
+
+DEFAULT_CONFIG.update(_load_config_overrides())
+
+# Shared HTTP session: keeps connections alive so the about-page fetch (and
+# repeat enrichments of popular hosts) reuse the homepage's TCP/TLS session.
+_session = requests.Session()
+_adapter = HTTPAdapter(
+    pool_connections=50,
+    pool_maxsize=50,
+    max_retries=Retry(
+        total=2,
+        read=0,
+        backoff_factor=0.3,
+        status_forcelist=[502, 503, 504],
+        allowed_methods=["GET"],
+    ),
+)
+_session.mount("https://", _adapter)
+_session.mount("http://", _adapter)
+
+# Redirects are followed manually so every hop is re-validated (SSRF protection)
+_MAX_REDIRECTS = 5
+
+# Characters of visible text kept per fetched page
+_PAGE_TEXT_LIMIT = 2000
+
+# Links that look like an "about" page (matched case-insensitively anywhere in the href)
+_ABOUT_LINK_PATTERN = re.compile(r"/(?:about|company|who-we-are|our-story)", re.IGNORECASE)
+
+# Bounds how many website fetches run at once in worker threads; one
+# semaphore per event loop and effective max_concurrent_fetches, created on
+# first use. Keyed weakly by loop: a semaphore binds to the first loop that
+# waits on it, and entries for closed loops are dropped with the loop.
+# Maps loop -> {limit: semaphore}.
+_fetch_semaphores: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+# robots.txt parsers cached per scheme://netloc. Failed lookups are cached
+# briefly (and treated as allowed, as before) so a flaky host is retried soon.
+_ROBOTS_CACHE_TTL_SECONDS = 24 * 3600
+_ROBOTS_ERROR_TTL_SECONDS = 300
+_ROBOTS_CACHE_MAX_ENTRIES = 1024
+_robots_cache: Dict[str, Tuple[float, Optional[RobotFileParser]]] = {}
+_robots_cache_lock = threading.Lock()
+
+# Hostname -> resolved IP (None when resolution failed) cached for a few
+# minutes so homepage/about-page validation and repeat enrichments of the same
+# host skip the blocking DNS lookup. Failures expire sooner.
+_DNS_CACHE_TTL_SECONDS = 300
+_DNS_ERROR_TTL_SECONDS = 30
+_DNS_CACHE_MAX_ENTRIES = 2048
+_dns_cache: Dict[str, Tuple[float, Optional[str]]] = {}
+_dns_cache_lock = threading.Lock()
+
+# Successful website fetches cached per URL (plus the config values that
+# shape the result) for cache_duration_hours, so re-enriching a company
+# doesn't repeat DNS + TLS + HTTP + parse. Errors are never cached.
+_WEBSITE_CACHE_MAX_ENTRIES = 512
+_WEBSITE_CACHE_KEY_FIELDS = (
+    "user_agent",
+    "max_response_size",
+    "website_fetch_timeout",
+    "skip_about_if_homepage_chars",
+)
+_website_cache: Dict[Tuple[Any, ...], Tuple[float, Dict[str, Any]]] = {}
+_website_cache_lock = threading.Lock()
+
+# Parsed page fields keyed by SHA-256 of the fetched bytes
+_PARSE_CACHE_MAX_ENTRIES = 512
+_parse_cache: Dict[bytes, Tuple[str, str, Optional[str]]] = {}
+_parse_cache_lock = threading.Lock()
+
 # Industry taxonomy
 INDUSTRIES = [
     "Financial Services",
@@ -81,12 +186,88 @@ CULTURE_SIGNALS = [
 # AI maturity levels
 AI_MATURITY_LEVELS = ["low", "developing", "advanced"]
 
+# O(1) membership views of the taxonomies; the lists keep prompt ordering
+_INDUSTRIES_SET = frozenset(INDUSTRIES)
+_SIZE_BANDS_SET = frozenset(SIZE_BANDS)
+
+# Trailing legal/corporate suffixes stripped by normalize_company_name.
+# Compiled once; the repeated group removes a chain such as "Holdings, Inc."
+_COMPANY_SUFFIX_PATTERN = re.compile(
+    r'(?:,?\s*(?:inc\.?|llc\.?|ltd\.?|corp\.?|corporation|company|co\.?|plc\.?'
+    r'|limited|l\.?p\.?|group|holdings?|international|global))+$',
+    re.IGNORECASE,
+)
+
+
+# Industry detection keywords for the heuristic fallback
+_INDUSTRY_KEYWORDS: Dict[str, List[str]] = {
+    "Financial Services": ["bank", "financial", "investment", "trading", "wealth", "asset management", "fintech", "insurance"],
+    "Technology": ["software", "technology", "tech", "saas", "platform", "digital", "cloud", "ai", "machine learning"],
+    "Healthcare": ["health", "medical", "pharma", "biotech", "clinical", "patient", "hospital"],
+    "Consulting": ["consulting", "advisory", "strategy", "management consulting", "professional services"],
+    "Manufacturing": ["manufacturing", "factory", "production", "industrial", "assembly"],
+    "Retail": ["retail", "e-commerce", "store", "shopping", "consumer goods"],
+    "Government": ["government", "federal", "state", "public sector", "agency"],
+    "Education": ["education", "university", "school", "learning", "academic", "edtech"],
+}
+
+# Culture signal keywords for the heuristic fallback
+_CULTURE_KEYWORDS: Dict[str, List[str]] = {
+    "formal": ["professional", "corporate", "established", "traditional"],
+    "innovative": ["innovation", "cutting-edge", "disrupt", "transform", "pioneering"],
+    "mission-driven": ["mission", "purpose", "impact", "change the world", "meaningful"],
+    "collaborative": ["team", "collaborative", "together", "partnership", "cross-functional"],
+    "fast-paced": ["fast-paced", "dynamic", "agile", "rapidly", "startup", "high-growth"],
+    "customer-centric": ["customer", "client-first", "user experience", "customer success"],
+    "data-driven": ["data-driven", "analytics", "metrics", "evidence-based", "data-informed"],
+    "experimental": ["experiment", "test and learn", "iterate", "fail fast", "prototype"],
+    "conservative": ["established", "stable", "reliable", "trusted", "heritage"],
+    "traditional": ["traditional", "legacy", "established practice", "proven"],
+}
+
+# Advanced AI maturity indicators
+_AI_ADVANCED_KEYWORDS: List[str] = [
+    "mlops", "ai governance", "ai ethics", "responsible ai",
+    "production ml", "model monitoring", "feature store",
+    "ai at scale", "enterprise ai", "ai platform", "ml platform",
+    "genai", "large language model", "llm", "ai transformation",
+]
+
+# Developing AI maturity indicators
+_AI_DEVELOPING_KEYWORDS: List[str] = [
+    "machine learning", "data science", "ai/ml", "data scientist",
+    "ml engineer", "analytics", "predictive", "ai strategy",
+    "data platform", "data lake", "data warehouse",
+]
+
+
+def _find_keywords(text: str, keywords: FrozenSet[str]) -> Set[str]:
+    """
+    Return the keywords that occur as substrings of text.
+
+    Each keyword is probed once even if several categories share it; the
+    per-category scoring then reduces to set membership.
+    """
+    return {kw for kw in keywords if kw in text}
+
+
+_INDUSTRY_KEYWORD_SET: FrozenSet[str] = frozenset(
+    kw for keywords in _INDUSTRY_KEYWORDS.values() for kw in keywords
+)
+_CULTURE_KEYWORD_SET: FrozenSet[str] = frozenset(
+    kw for keywords in _CULTURE_KEYWORDS.values() for kw in keywords
+)
+_AI_MATURITY_KEYWORD_SET: FrozenSet[str] = frozenset(
+    _AI_ADVANCED_KEYWORDS + _AI_DEVELOPING_KEYWORDS
+)
+
 
 def normalize_company_name(name: str) -> str:
     """
     Normalize company name for deduplication.
 
     Removes common suffixes (Inc., LLC, Corp, etc.) and standardizes whitespace.
+    Results are memoized, since the same names recur across enrichments.
 
     Args:
         name: Raw company name
@@ -97,33 +278,20 @@ def normalize_company_name(name: str) -> str:
     if not name:
         return ""
 
-    # Limit input length to prevent ReDoS attacks
+    # Limit input length to prevent ReDoS attacks (and bound cache key size)
     if len(name) > 500:
         name = name[:500]
 
+    return _normalize_company_name_cached(name)
+
+
+@lru_cache(maxsize=4096)
+def _normalize_company_name_cached(name: str) -> str:
     # Convert to lowercase and strip whitespace
     normalized = name.lower().strip()
 
-    # Remove common suffixes
-    suffixes = [
-        r',?\s*inc\.?$',
-        r',?\s*llc\.?$',
-        r',?\s*ltd\.?$',
-        r',?\s*corp\.?$',
-        r',?\s*corporation$',
-        r',?\s*company$',
-        r',?\s*co\.?$',
-        r',?\s*plc\.?$',
-        r',?\s*limited$',
-        r',?\s*l\.?p\.?$',
-        r',?\s*group$',
-        r',?\s*holdings?$',
-        r',?\s*international$',
-        r',?\s*global$',
-    ]
-
-    for pattern in suffixes:
-        normalized = re.sub(pattern, '', normalized, flags=re.IGNORECASE)
+    # Remove common suffixes (one pass strips a trailing chain like ", inc.")
+    normalized = _COMPANY_SUFFIX_PATTERN.sub('', normalized)
 
     # Normalize whitespace
     normalized = ' '.join(normalized.split())
@@ -152,7 +320,9 @@ def is_private_ip(hostname: str) -> bool:
             pass
 
         # Resolve hostname to IP
-        resolved_ip = socket.gethostbyname(hostname)
+        resolved_ip = _resolve_hostname(hostname)
+        if resolved_ip is None:
+            return True
         ip = ip_address(resolved_ip)
         return ip.is_private or ip.is_loopback or ip.is_reserved
 
@@ -161,6 +331,39 @@ def is_private_ip(hostname: str) -> bool:
         return True
 
 
+def _resolve_hostname(hostname: str) -> Optional[str]:
+    """
+    Resolve a hostname to an IPv4 address, using the short-lived DNS cache.
+
+    Args:
+        hostname: Hostname to resolve
+
+    Returns:
+        Resolved IP string, or None if the hostname could not be resolved
+    """
+    key = hostname.lower()
+    now = time.monotonic()
+
+    with _dns_cache_lock:
+        cached = _dns_cache.get(key)
+    if cached and cached[0] > now:
+        return cached[1]
+
+    try:
+        resolved_ip = socket.gethostbyname(hostname)
+        expires_at = now + _DNS_CACHE_TTL_SECONDS
+    except (socket.gaierror, socket.herror):
+        resolved_ip = None
+        expires_at = now + _DNS_ERROR_TTL_SECONDS
+
+    with _dns_cache_lock:
+        if len(_dns_cache) >= _DNS_CACHE_MAX_ENTRIES:
+            _dns_cache.pop(next(iter(_dns_cache)))
+        _dns_cache[key] = (expires_at, resolved_ip)
+
+    return resolved_ip
+
+
 def validate_url(url: str) -> Tuple[bool, str]:
     """
     Validate URL for security concerns.
@@ -209,6 +412,9 @@ def check_robots_txt(url: str, user_agent: str = "*") -> bool:
     """
     Check if robots.txt allows fetching the given URL.
 
+    Parsed robots.txt files are cached per host for _ROBOTS_CACHE_TTL_SECONDS,
+    so repeat enrichments of the same site skip the extra HTTP round-trip.
+
     Args:
         url: URL to check
         user_agent: User agent to check for (default: *)
@@ -218,18 +424,154 @@ def check_robots_txt(url: str, user_agent: str = "*") -> bool:
     """
     try:
         parsed = urlparse(url)
-        robots_url = f"{parsed.scheme}://{parsed.netloc}/robots.txt"
+        cache_key = f"{parsed.scheme}://{parsed.netloc}"
+        now = time.monotonic()
 
-        rp = RobotFileParser()
-        rp.set_url(robots_url)
-        rp.read()
+        with _robots_cache_lock:
+            cached = _robots_cache.get(cache_key)
+        if cached and cached[0] > now:
+            rp = cached[1]
+        else:
+            rp = RobotFileParser()
+            rp.set_url(f"{cache_key}/robots.txt")
+            try:
+                rp.read()
+                expires_at = now + _ROBOTS_CACHE_TTL_SECONDS
+            except Exception:
+                rp = None
+                expires_at = now + _ROBOTS_ERROR_TTL_SECONDS
+
+            with _robots_cache_lock:
+                if len(_robots_cache) >= _ROBOTS_CACHE_MAX_ENTRIES:
+                    _robots_cache.pop(next(iter(_robots_cache)))
+                _robots_cache[cache_key] = (expires_at, rp)
 
-        return rp.can_fetch(user_agent, url)
+        # If we can't check robots.txt, assume allowed
+        return rp.can_fetch(user_agent, url) if rp else True
     except Exception:
         # If we can't check robots.txt, assume allowed
         return True
 
 
+def _bounded_text(soup: BeautifulSoup, limit: int) -> str:
+    """
+    Join a document's stripped text nodes, stopping once limit is reached.
+
+    Equivalent to soup.get_text(separator=' ', strip=True)[:limit] without
+    building the full-document string for large pages.
+
+    Args:
+        soup: Parsed document
+        limit: Maximum number of characters to return
+
+    Returns:
+        Space-joined visible text, at most limit characters long
+    """
+    parts = []
+    length = 0
+    for string in soup.stripped_strings:
+        parts.append(string)
+        length += len(string) + 1
+        if length > limit:
+            break
+    return ' '.join(parts)[:limit]
+
+
+def _parse_page(content: bytes) -> Tuple[str, str, Optional[str]]:
+    """
+    Extract the enrichment fields from a fetched HTML page.
+
+    Results are cached by SHA-256 of the raw bytes, so different URLs serving
+    identical pages (mirrors, redirects, re-fetches after the URL cache
+    expires) are parsed once.
+
+    Args:
+        content: Raw HTML bytes (already size-limited)
+
+    Returns:
+        Tuple of (meta_description, visible_text, about_link_href_or_None)
+    """
+    digest = hashlib.sha256(content).digest()
+    with _parse_cache_lock:
+        cached = _parse_cache.get(digest)
+    if cached is not None:
+        return cached
+
+    soup = BeautifulSoup(content, _HTML_PARSER)
+
+    meta_description = ""
+    meta_desc = soup.find('meta', attrs={'name': 'description'})
+    if meta_desc:
+        meta_description = meta_desc.get('content', '')[:500]
+
+    # Remove script, style and boilerplate elements before extracting text
+    for script in soup(["script", "style", "nav", "footer", "header"]):
+        script.decompose()
+
+    text = _bounded_text(soup, _PAGE_TEXT_LIMIT)
+
+    about_href = None
+    for link in soup.find_all('a', href=True):
+        if _ABOUT_LINK_PATTERN.search(link['href']):
+            about_href = link['href']
+            break
+
+    parsed = (meta_description, text, about_href)
+    with _parse_cache_lock:
+        if len(_parse_cache) >= _PARSE_CACHE_MAX_ENTRIES:
+            _parse_cache.pop(next(iter(_parse_cache)))
+        _parse_cache[digest] = parsed
+    return parsed
+
+
+def _get_with_validated_redirects(
+    url: str,
+    headers: Dict[str, str],
+    timeout: float,
+    stream: bool = False
+) -> requests.Response:
+    """
+    GET a URL through the shared session, validating each redirect hop.
+
+    requests' built-in redirect handling would happily follow a Location
+    header to a private address (e.g. cloud metadata endpoints), so
+    redirects are disabled and each target is resolved with urljoin and run
+    through validate_url before it is requested.
+
+    Args:
+        url: Already-validated URL to fetch
+        headers: Request headers
+        timeout: Per-request timeout in seconds
+        stream: Whether to stream the final response body
+
+    Returns:
+        The final non-redirect response
+
+    Raises:
+        requests.exceptions.InvalidURL: If a redirect targets a disallowed URL
+        requests.TooManyRedirects: If more than _MAX_REDIRECTS hops are seen
+    """
+    for _ in range(_MAX_REDIRECTS + 1):
+        response = _session.get(
+            url,
+            headers=headers,
+            timeout=timeout,
+            allow_redirects=False,
+            stream=stream,
+        )
+        if not response.is_redirect:
+            return response
+
+        next_url = urljoin(url, response.headers['location'])
+        response.close()
+        is_valid, error_msg = validate_url(next_url)
+        if not is_valid:
+            raise requests.exceptions.InvalidURL(f"Redirect to {next_url} blocked: {error_msg}")
+        url = next_url
+
+    raise requests.TooManyRedirects(f"Exceeded {_MAX_REDIRECTS} redirects")
+
+
 def fetch_company_website_data(
     website_url: str,
     config: Optional[Dict[str, Any]] = None
@@ -237,8 +579,11 @@ def fetch_company_website_data(
     """
     Fetch and parse company website content for enrichment.
 
-    Note: This is a synchronous function that uses requests library.
-    It should be called from async context using run_in_executor if needed.
+    Note: This is a synchronous function that uses a shared requests.Session.
+    From async code use fetch_company_website_data_async instead.
+
+    Successful results are cached in-process for cache_duration_hours;
+    pass force_refresh=True in config to bypass the cache.
 
     Security measures:
     - URL validation (no private IPs)
@@ -254,6 +599,28 @@ def fetch_company_website_data(
         Dict with homepage_text, about_text, meta_description (may be empty on error)
     """
     cfg = {**DEFAULT_CONFIG, **(config or {})}
+    cache_key = (website_url, *(cfg[field] for field in _WEBSITE_CACHE_KEY_FIELDS))
+
+    if not cfg["force_refresh"]:
+        with _website_cache_lock:
+            cached = _website_cache.get(cache_key)
+        if cached and cached[0] > time.monotonic():
+            return dict(cached[1])
+
+    result = _fetch_company_website_data_uncached(website_url, cfg)
+
+    if result["error"] is None:
+        expires_at = time.monotonic() + cfg["cache_duration_hours"] * 3600
+        with _website_cache_lock:
+            if len(_website_cache) >= _WEBSITE_CACHE_MAX_ENTRIES:
+                _website_cache.pop(next(iter(_website_cache)))
+            _website_cache[cache_key] = (expires_at, dict(result))
+
+    return result
+
+
+def _fetch_company_website_data_uncached(website_url: str, cfg: Dict[str, Any]) -> Dict[str, Any]:
+    """Fetch and parse a company website; see fetch_company_website_data."""
     result = {
         "homepage_text": "",
         "about_text": "",
@@ -283,65 +650,40 @@ def fetch_company_website_data(
         }
 
         # Fetch homepage
-        response = requests.get(
+        response = _get_with_validated_redirects(
             website_url,
-            headers=headers,
-            timeout=cfg["website_fetch_timeout"],
-            allow_redirects=True,
+            headers,
+            cfg["website_fetch_timeout"],
             stream=True,
         )
         response.raise_for_status()
 
-        # Check content size
-        content_length = int(response.headers.get('content-length', 0))
-        if content_length > cfg["max_response_size"]:
-            logger.warning(f"Response too large ({content_length} bytes): {website_url}")
-            result["error"] = "Response too large"
-            return result
-
-        # Read with size limit
-        content = b""
+        # Read with size limit (bytearray.extend avoids re-copying on each chunk)
+        buffer = bytearray()
         for chunk in response.iter_content(chunk_size=8192):
-            content += chunk
-            if len(content) > cfg["max_response_size"]:
+            buffer.extend(chunk)
+            if len(buffer) > cfg["max_response_size"]:
                 break
+        content = bytes(buffer)
+        response.close()
 
-        # Parse HTML
-        soup = BeautifulSoup(content, 'html.parser')
-
-        # Extract meta description
-        meta_desc = soup.find('meta', attrs={'name': 'description'})
-        if meta_desc:
-            result["meta_description"] = meta_desc.get('content', '')[:500]
-
-        # Extract main page text (limited)
-        # Remove script and style elements
-        for script in soup(["script", "style", "nav", "footer", "header"]):
-            script.decompose()
-
-        text = soup.get_text(separator=' ', strip=True)
-        result["homepage_text"] = text[:2000]
-
-        # Try to find about page link
-        parsed = urlparse(website_url)
-        base_url = f"{parsed.scheme}://{parsed.netloc}"
+        # Parse HTML (identical bytes, e.g. www/apex mirrors, reuse the parse)
+        meta_description, homepage_text, about_href = _parse_page(content)
+        result["meta_description"] = meta_description
+        result["homepage_text"] = homepage_text
 
-        about_patterns = ['/about', '/about-us', '/company', '/who-we-are', '/our-story']
+        # Follow the about page link, unless the homepage already gave us
+        # enough text for inference (saves a round-trip and a second parse)
         about_link = None
-
-        for link in soup.find_all('a', href=True):
-            href = link['href'].lower()
-            for pattern in about_patterns:
-                if pattern in href:
-                    about_link = link['href']
-                    break
-            if about_link:
-                break
+        skip_about_chars = cfg["skip_about_if_homepage_chars"]
+        if not skip_about_chars or len(homepage_text) < skip_about_chars:
+            about_link = about_href
 
         # Fetch about page if found
         if about_link:
-            if not about_link.startswith('http'):
-                about_link = base_url + about_link if about_link.startswith('/') else base_url + '/' + about_link
+            # urljoin handles scheme-relative (//host/path) and ?query forms;
+            # resolve against the post-redirect URL like a browser would
+            about_link = urljoin(response.url or website_url, about_link)
 
             # Validate the reconstructed about-page URL (SSRF protection)
             about_is_valid, about_error = validate_url(about_link)
@@ -349,20 +691,16 @@ def fetch_company_website_data(
                 logger.warning(f"About page URL validation failed for {about_link}: {about_error}")
             else:
                 try:
-                    about_response = requests.get(
+                    about_response = _get_with_validated_redirects(
                         about_link,
-                        headers=headers,
-                        timeout=cfg["website_fetch_timeout"],
-                        allow_redirects=True,
+                        headers,
+                        cfg["website_fetch_timeout"],
                     )
                     about_response.raise_for_status()
 
-                    about_soup = BeautifulSoup(about_response.content[:cfg["max_response_size"]], 'html.parser')
-                    for script in about_soup(["script", "style", "nav", "footer", "header"]):
-                        script.decompose()
-
-                    about_text = about_soup.get_text(separator=' ', strip=True)
-                    result["about_text"] = about_text[:2000]
+                    _, result["about_text"], _ = _parse_page(
+                        about_response.content[:cfg["max_response_size"]]
+                    )
 
                 except requests.Timeout:
                     logger.info(f"Timeout fetching about page: {about_link}")
@@ -382,11 +720,46 @@ def fetch_company_website_data(
     return result
 
 
+def _combine_lower(website_content: Optional[str], jd_text: Optional[str]) -> str:
+    """Build the lowercased text the keyword heuristics scan."""
+    return f"{website_content or ''} {jd_text or ''}".lower()
+
+
+async def fetch_company_website_data_async(
+    website_url: str,
+    config: Optional[Dict[str, Any]] = None
+) -> Dict[str, Any]:
+    """
+    Async wrapper for fetch_company_website_data.
+
+    Runs the blocking fetch in a worker thread so the event loop keeps
+    serving other requests, with at most max_concurrent_fetches (from config,
+    else config.yaml/DEFAULT_CONFIG) in flight.
+
+    Args:
+        website_url: Company website URL
+        config: Optional configuration overrides
+
+    Returns:
+        Same dict as fetch_company_website_data
+    """
+    cfg = {**DEFAULT_CONFIG, **(config or {})}
+    limit = cfg["max_concurrent_fetches"]
+    loop_semaphores = _fetch_semaphores.setdefault(asyncio.get_running_loop(), {})
+    semaphore = loop_semaphores.get(limit)
+    if semaphore is None:
+        semaphore = loop_semaphores[limit] = asyncio.Semaphore(limit)
+
+    async with semaphore:
+        return await asyncio.to_thread(fetch_company_website_data, website_url, config)
+
+
 async def infer_industry_and_size(
     company_name: str,
     website_content: Optional[str] = None,
     jd_text: Optional[str] = None,
-    llm: Optional[Any] = None
+    llm: Optional[Any] = None,
+    combined_lower: Optional[str] = None
 ) -> Dict[str, Optional[str]]:
     """
     Infer company industry and size band from available data.
@@ -399,6 +772,8 @@ async def infer_industry_and_size(
         website_content: Optional website text content
         jd_text: Optional job description text
         llm: Optional LLM instance (defaults to MockLLM)
+        combined_lower: Optional precomputed lowercased
+            "{website_content} {jd_text}" to skip rebuilding it
 
     Returns:
         Dict with industry, size_band, headquarters (may be None)
@@ -430,12 +805,14 @@ If uncertain, use null for that field."""
             result = await llm.generate_company_metadata(company_name, context)
         else:
             # Fallback for MockLLM - use heuristics
-            result = _infer_metadata_heuristic(company_name, website_content, jd_text)
+            result = _infer_metadata_heuristic(
+                company_name, website_content, jd_text, combined_lower=combined_lower
+            )
 
         # Validate results against taxonomy
-        if result.get('industry') and result['industry'] not in INDUSTRIES:
+        if result.get('industry') and result['industry'] not in _INDUSTRIES_SET:
             result['industry'] = 'Other'
-        if result.get('size_band') and result['size_band'] not in SIZE_BANDS:
+        if result.get('size_band') and result['size_band'] not in _SIZE_BANDS_SET:
             result['size_band'] = None
 
         return result
@@ -448,32 +825,24 @@ If uncertain, use null for that field."""
 def _infer_metadata_heuristic(
     company_name: str,
     website_content: Optional[str] = None,
-    jd_text: Optional[str] = None
+    jd_text: Optional[str] = None,
+    combined_lower: Optional[str] = None
 ) -> Dict[str, Optional[str]]:
     """
     Heuristic-based company metadata inference.
 
     Used as fallback when LLM is not available.
     """
-    combined_text = f"{company_name} {website_content or ''} {jd_text or ''}".lower()
-
-    # Industry detection patterns
-    industry_patterns = {
-        "Financial Services": ["bank", "financial", "investment", "trading", "wealth", "asset management", "fintech", "insurance"],
-        "Technology": ["software", "technology", "tech", "saas", "platform", "digital", "cloud", "ai", "machine learning"],
-        "Healthcare": ["health", "medical", "pharma", "biotech", "clinical", "patient", "hospital"],
-        "Consulting": ["consulting", "advisory", "strategy", "management consulting", "professional services"],
-        "Manufacturing": ["manufacturing", "factory", "production", "industrial", "assembly"],
-        "Retail": ["retail", "e-commerce", "store", "shopping", "consumer goods"],
-        "Government": ["government", "federal", "state", "public sector", "agency"],
-        "Education": ["education", "university", "school", "learning", "academic", "edtech"],
-    }
+    if combined_lower is None:
+        combined_lower = _combine_lower(website_content, jd_text)
+    combined_text = f"{company_name.lower()} {combined_lower}"
 
+    found = _find_keywords(combined_text, _INDUSTRY_KEYWORD_SET)
     detected_industry = None
     max_matches = 0
 
-    for industry, keywords in industry_patterns.items():
-        matches = sum(1 for kw in keywords if kw in combined_text)
+    for industry, keywords in _INDUSTRY_KEYWORDS.items():
+        matches = sum(1 for kw in keywords if kw in found)
         if matches > max_matches:
             max_matches = matches
             detected_industry = industry
@@ -497,7 +866,8 @@ def _infer_metadata_heuristic(
 async def infer_culture_signals(
     website_content: Optional[str] = None,
     jd_text: Optional[str] = None,
-    llm: Optional[Any] = None
+    llm: Optional[Any] = None,
+    combined_lower: Optional[str] = None
 ) -> List[str]:
     """
     Extract culture signals from website content and job description.
@@ -509,32 +879,21 @@ async def infer_culture_signals(
         website_content: Optional website text content
         jd_text: Optional job description text
         llm: Optional LLM instance (defaults to MockLLM)
+        combined_lower: Optional precomputed lowercased
+            "{website_content} {jd_text}" to skip rebuilding it
 
     Returns:
         List of culture signals (max 5) from CULTURE_SIGNALS taxonomy
     """
-    combined_text = f"{website_content or ''} {jd_text or ''}".lower()
+    combined_text = combined_lower if combined_lower is not None else _combine_lower(website_content, jd_text)
 
     if not combined_text.strip():
         return []
 
-    # Keyword-based culture detection
-    culture_keywords = {
-        "formal": ["professional", "corporate", "established", "traditional"],
-        "innovative": ["innovation", "cutting-edge", "disrupt", "transform", "pioneering"],
-        "mission-driven": ["mission", "purpose", "impact", "change the world", "meaningful"],
-        "collaborative": ["team", "collaborative", "together", "partnership", "cross-functional"],
-        "fast-paced": ["fast-paced", "dynamic", "agile", "rapidly", "startup", "high-growth"],
-        "customer-centric": ["customer", "client-first", "user experience", "customer success"],
-        "data-driven": ["data-driven", "analytics", "metrics", "evidence-based", "data-informed"],
-        "experimental": ["experiment", "test and learn", "iterate", "fail fast", "prototype"],
-        "conservative": ["established", "stable", "reliable", "trusted", "heritage"],
-        "traditional": ["traditional", "legacy", "established practice", "proven"],
-    }
-
+    found = _find_keywords(combined_text, _CULTURE_KEYWORD_SET)
     detected_signals = []
-    for signal, keywords in culture_keywords.items():
-        if any(kw in combined_text for kw in keywords):
+    for signal, keywords in _CULTURE_KEYWORDS.items():
+        if any(kw in found for kw in keywords):
             detected_signals.append(signal)
 
     # Limit to 5 signals
@@ -544,7 +903,8 @@ async def infer_culture_signals(
 async def infer_ai_maturity(
     website_content: Optional[str] = None,
     jd_text: Optional[str] = None,
-    llm: Optional[Any] = None
+    llm: Optional[Any] = None,
+    combined_lower: Optional[str] = None
 ) -> Optional[str]:
     """
     Infer company's AI/data maturity level.
@@ -561,33 +921,21 @@ async def infer_ai_maturity(
         website_content: Optional website text content
         jd_text: Optional job description text
         llm: Optional LLM instance (defaults to MockLLM)
+        combined_lower: Optional precomputed lowercased
+            "{website_content} {jd_text}" to skip rebuilding it
 
     Returns:
         AI maturity level string or None if insufficient data
     """
-    combined_text = f"{website_content or ''} {jd_text or ''}".lower()
+    combined_text = combined_lower if combined_lower is not None else _combine_lower(website_content, jd_text)
 
     if not combined_text.strip():
         return None
 
-    # Advanced maturity indicators
-    advanced_keywords = [
-        "mlops", "ai governance", "ai ethics", "responsible ai",
-        "production ml", "model monitoring", "feature store",
-        "ai at scale", "enterprise ai", "ai platform", "ml platform",
-        "genai", "large language model", "llm", "ai transformation",
-    ]
-
-    # Developing maturity indicators
-    developing_keywords = [
-        "machine learning", "data science", "ai/ml", "data scientist",
-        "ml engineer", "analytics", "predictive", "ai strategy",
-        "data platform", "data lake", "data warehouse",
-    ]
-
     # Count indicators
-    advanced_count = sum(1 for kw in advanced_keywords if kw in combined_text)
-    developing_count = sum(1 for kw in developing_keywords if kw in combined_text)
+    found = _find_keywords(combined_text, _AI_MATURITY_KEYWORD_SET)
+    advanced_count = sum(1 for kw in _AI_ADVANCED_KEYWORDS if kw in found)
+    developing_count = sum(1 for kw in _AI_DEVELOPING_KEYWORDS if kw in found)
 
     if advanced_count >= 2:
         return "advanced"
@@ -644,53 +992,53 @@ async def enrich_company_profile(
     company_name = company_name.strip()
     normalized_name = normalize_company_name(company_name)
 
-    # Check for existing profile
+    # Check for an existing profile by exact name or by normalized name
+    # (e.g. "Acme, Inc." vs "Acme Corporation") in one round-trip,
+    # preferring the exact-name match when both exist
+    match_condition = CompanyProfile.name == company_name
+    if normalized_name:
+        match_condition = or_(
+            match_condition,
+            CompanyProfile.normalized_name == normalized_name,
+        )
     existing_profile = db.query(CompanyProfile).filter(
-        CompanyProfile.name == company_name
+        match_condition
+    ).order_by(
+        case((CompanyProfile.name == company_name, 0), else_=1)
     ).first()
 
-    # Also check normalized name match using database ILIKE (scalable approach)
-    # Instead of loading all profiles, use SQL pattern matching
-    if not existing_profile and normalized_name:
-        # Search for profiles that might match after normalization
-        # Using ILIKE with the normalized name as a pattern
-        potential_matches = db.query(CompanyProfile).filter(
-            CompanyProfile.name.ilike(f"%{normalized_name}%")
-        ).limit(20).all()
-
-        for profile in potential_matches:
-            if normalize_company_name(profile.name) == normalized_name:
-                existing_profile = profile
-                break
-
-    # Fetch website data if URL provided (synchronous call)
+    # Fetch website data if URL provided (off the event loop)
     website_data = {}
     if website_url:
-        website_data = fetch_company_website_data(website_url, config)
+        website_data = await fetch_company_website_data_async(website_url, config)
 
     # Combine website content
     website_content = None
     if website_data.get("homepage_text") or website_data.get("about_text"):
         website_content = f"{website_data.get('homepage_text', '')} {website_data.get('about_text', '')}".strip()
 
-    # Infer metadata
-    metadata = await infer_industry_and_size(
-        company_name, website_content, jd_text, llm
-    )
-
-    # Get culture signals
-    culture_signals = await infer_culture_signals(
-        website_content, jd_text, llm
-    )
-
-    # Get AI maturity
-    ai_maturity = await infer_ai_maturity(
-        website_content, jd_text, llm
+    # Lowercase the combined text once for all three inference steps
+    combined_lower = _combine_lower(website_content, jd_text)
+
+    # Infer metadata, culture signals and AI maturity concurrently
+    # (each is an independent LLM round-trip when a real provider is used)
+    metadata, culture_signals, ai_maturity = await asyncio.gather(
+        infer_industry_and_size(
+            company_name, website_content, jd_text, llm, combined_lower=combined_lower
+        ),
+        infer_culture_signals(
+            website_content, jd_text, llm, combined_lower=combined_lower
+        ),
+        infer_ai_maturity(
+            website_content, jd_text, llm, combined_lower=combined_lower
+        ),
     )
 
     # Create or update profile
     if existing_profile:
         # Update existing profile with new data (don't overwrite with None)
+        if not existing_profile.normalized_name:
+            existing_profile.normalized_name = normalize_company_name(existing_profile.name)
         if website_url and not existing_profile.website:
             existing_profile.website = website_url
         if metadata.get('industry') and not existing_profile.industry:
@@ -714,6 +1062,7 @@ async def enrich_company_profile(
         # Create new profile
         new_profile = CompanyProfile(
             name=company_name,
+            normalized_name=normalized_name,
             website=website_url,
             industry=metadata.get('industry'),
             size_band=metadata.get('size_band'),
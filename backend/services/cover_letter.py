@@ -5,17 +5,29 @@ Generates tailored cover letters with tone compliance, ATS optimization,
 banned phrase checking, and quality scoring.
 """
 
+import asyncio
+import heapq
 import logging
 import os
 import re
+from bisect import bisect_left
 from datetime import datetime, timezone
-from typing import Dict, List, Optional, Set, Tuple
+from functools import lru_cache
+from operator import attrgetter
+from types import SimpleNamespace
+from typing import Dict, FrozenSet, List, Optional, Set, Tuple
 
 import yaml
 from sqlalchemy.orm import Session
 
 from db.models import CompanyProfile, JobProfile, User
 
+# Prefer the libyaml-backed loader (~10x faster); same safe semantics
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
 
 # Configuration loader
 def _load_config() -> dict:
@@ -25,7 +37,7 @@ def _load_config() -> dict:
     )
     try:
         with open(config_path, 'r') as f:
-            return yaml.safe_load(f)
+            return yaml.load(f, Loader=_YamlLoader)
     except FileNotFoundError:
         return {}
 
@@ -43,11 +55,17 @@ from schemas.cover_letter import (
     RequirementCoverage,
     ToneComplianceResult,
 )
-from schemas.skill_gap import SkillGapResponse
+from schemas.skill_gap import SkillGapResponse, SkillMatch
 from schemas.capability import CapabilityClusterAnalysis
 from services.llm.base import BaseLLM
 from services.llm import create_llm
-from services.skill_gap import analyze_skill_gap, get_cluster_analysis, find_skill_match, normalize_skill
+from services.skill_gap import (
+    SKILL_SYNONYMS,
+    analyze_skill_gap,
+    get_cluster_analysis,
+    find_skill_match,
+    normalize_skill,
+)
 # Sprint 8: Learning from approved outputs (available for future integration)
 from services.output_retrieval import (
     retrieve_similar_cover_letter_paragraphs,
@@ -58,27 +76,31 @@ from services.output_retrieval import (
 logger = logging.getLogger(__name__)
 
 
+# Words that should not end a truncated phrase (articles, prepositions, etc.)
+_BAD_ENDINGS = frozenset({
+    'the', 'a', 'an', 'of', 'for', 'to', 'at', 'in', 'on', 'by', 'with',
+    'and', 'or', 'but', 'as', 'from', 'into', 'through', 'during', 'before',
+    'after', 'above', 'below', 'between', 'under', 'over', 'its', 'their',
+    'our', 'my', 'your', 'this', 'that', 'these', 'those', 'all', 'each',
+    'every', 'both', 'few', 'more', 'most', 'other', 'some', 'such', 'no',
+    'five', 'three', 'two', 'ten', 'first', 'second', 'third'
+})
+
+
+@lru_cache(maxsize=2048)
 def smart_truncate(text: Optional[str], max_length: int = 100) -> str:
     """Truncate text at natural boundaries without cutting mid-word or mid-sentence.
 
     Prioritizes keeping complete thoughts over strict length limits.
     Avoids ending on articles, prepositions, or incomplete phrases.
+    Pure, so results are memoized: outlines for the same job repeatedly
+    truncate the same evidence and capability strings.
     """
     if not text:
         return ""
     if len(text) <= max_length:
         return text
 
-    # Words that should not end a sentence (articles, prepositions, etc.)
-    bad_endings = {
-        'the', 'a', 'an', 'of', 'for', 'to', 'at', 'in', 'on', 'by', 'with',
-        'and', 'or', 'but', 'as', 'from', 'into', 'through', 'during', 'before',
-        'after', 'above', 'below', 'between', 'under', 'over', 'its', 'their',
-        'our', 'my', 'your', 'this', 'that', 'these', 'those', 'all', 'each',
-        'every', 'both', 'few', 'more', 'most', 'other', 'some', 'such', 'no',
-        'five', 'three', 'two', 'ten', 'first', 'second', 'third'
-    }
-
     # Try to find a sentence boundary within limit (strong preference)
     truncated = text[:max_length]
 
@@ -123,11 +145,11 @@ def smart_truncate(text: Optional[str], max_length: int = 100) -> str:
     last_space = truncated.rfind(' ')
     while last_space > max_length // 3:
         candidate = text[:last_space].strip()
-        last_word = candidate.split()[-1].lower().rstrip('.,;:') if candidate.split() else ''
-        if last_word not in bad_endings:
+        last_word = candidate.rsplit(None, 1)[-1].lower().rstrip('.,;:') if candidate else ''
+        if last_word not in _BAD_ENDINGS:
             return candidate
-        # Try earlier word boundary
-        last_space = text[:last_space].rfind(' ')
+        # Try earlier word boundary (search in place rather than re-slicing)
+        last_space = text.rfind(' ', 0, last_space)
 
     # If we can't find a good boundary, just use the truncated text
     return truncated.strip()
@@ -194,23 +216,41 @@ BANNED_PHRASES: Dict[str, str] = {
 # Note: Only match true em-dash (U+2014), not double hyphens which are valid in compound words
 EM_DASH_PATTERN = r'—'
 
-# Pre-compiled regex patterns for performance (avoid re-compiling in loops)
-_EM_DASH_COMPILED = re.compile(EM_DASH_PATTERN)
+# Pre-compiled regex patterns for performance (avoid re-compiling in loops);
+# shared with the critic's em-dash check
+EM_DASH_RE = re.compile(EM_DASH_PATTERN)
 
 # Pre-compiled phrase boundary pattern template
 # Used for banned phrases and keyword matching
+@lru_cache(maxsize=4096)
 def _compile_phrase_pattern(phrase: str) -> re.Pattern:
-    """Compile a phrase pattern with word boundaries (case-insensitive)."""
+    """Compile a phrase pattern with word boundaries.
+
+    Memoized: ATS keywords, synonym variants and requirement words recur
+    across letters and jobs.
+
+    Matching is case-sensitive: callers lowercase both the phrase and the
+    text. The pattern starts with the literal phrase (the preceding-letter
+    check is a fixed-width lookbehind after it) so the regex engine can use
+    its fast literal-prefix search instead of trying every position.
+    """
+    escaped = re.escape(phrase)
     return re.compile(
-        r'(?<![a-zA-Z])' + re.escape(phrase) + r'(?![a-zA-Z])',
-        re.IGNORECASE
+        escaped + r'(?<![a-zA-Z]' + escaped + r')(?![a-zA-Z])'
     )
 
-# Pre-compile banned phrase patterns at module load time
-_BANNED_PHRASE_PATTERNS: dict[str, re.Pattern] = {
-    phrase: _compile_phrase_pattern(phrase)
-    for phrase in BANNED_PHRASES.keys()
-}
+# Pre-compile banned phrase patterns at module load time, flattened to
+# (phrase, severity, pattern) so the hot loop needs no dict lookups. Patterns
+# are case-sensitive: match them against lowercased text. Shared with the
+# critic's banned phrase check.
+BANNED_PHRASE_PATTERNS: Tuple[Tuple[str, str, re.Pattern], ...] = tuple(
+    (phrase, severity, _compile_phrase_pattern(phrase))
+    for phrase, severity in BANNED_PHRASES.items()
+)
+
+# Severity ordering for picking the overall severity of a check
+_SEVERITY_LEVELS = ("none", "minor", "major", "critical")
+_SEVERITY_RANK = {severity: rank for rank, severity in enumerate(_SEVERITY_LEVELS)}
 
 # Structure templates from style guide Section 3
 STRUCTURE_TEMPLATES = {
@@ -235,74 +275,112 @@ STRUCTURE_TEMPLATES = {
 }
 
 # Tone compatibility matrix for scoring
-# Keys are (target_tone, detected_tone) tuples, values are compatibility scores
-TONE_COMPATIBILITY: Dict[Tuple[str, str], float] = {
+# Compatibility is symmetric, so each pair is stored once under
+# frozenset({tone_a, tone_b}); exact matches are single-element sets.
+# Use get_tone_compatibility() rather than indexing directly.
+TONE_COMPATIBILITY: Dict[FrozenSet[str], float] = {
     # Exact matches
-    ('formal_corporate', 'formal_corporate'): 1.0,
-    ('startup_casual', 'startup_casual'): 1.0,
-    ('consulting_professional', 'consulting_professional'): 1.0,
-    ('mission_driven', 'mission_driven'): 1.0,
-    ('technical_precise', 'technical_precise'): 1.0,
-    ('academic_research', 'academic_research'): 1.0,
+    frozenset({'formal_corporate'}): 1.0,
+    frozenset({'startup_casual'}): 1.0,
+    frozenset({'consulting_professional'}): 1.0,
+    frozenset({'mission_driven'}): 1.0,
+    frozenset({'technical_precise'}): 1.0,
+    frozenset({'academic_research'}): 1.0,
 
     # Highly compatible pairs (0.85)
-    ('formal_corporate', 'consulting_professional'): 0.85,
-    ('consulting_professional', 'formal_corporate'): 0.85,
-    ('technical_precise', 'formal_corporate'): 0.85,
-    ('formal_corporate', 'technical_precise'): 0.85,
-    ('consulting_professional', 'technical_precise'): 0.85,
-    ('technical_precise', 'consulting_professional'): 0.85,
+    frozenset({'formal_corporate', 'consulting_professional'}): 0.85,
+    frozenset({'formal_corporate', 'technical_precise'}): 0.85,
+    frozenset({'consulting_professional', 'technical_precise'}): 0.85,
 
     # Moderately compatible pairs (0.70)
-    ('mission_driven', 'startup_casual'): 0.70,
-    ('startup_casual', 'mission_driven'): 0.70,
-    ('mission_driven', 'consulting_professional'): 0.70,
-    ('consulting_professional', 'mission_driven'): 0.70,
-    ('academic_research', 'technical_precise'): 0.70,
-    ('technical_precise', 'academic_research'): 0.70,
+    frozenset({'mission_driven', 'startup_casual'}): 0.70,
+    frozenset({'mission_driven', 'consulting_professional'}): 0.70,
+    frozenset({'academic_research', 'technical_precise'}): 0.70,
 
     # Less compatible but acceptable pairs (0.55)
-    ('startup_casual', 'formal_corporate'): 0.55,
-    ('formal_corporate', 'startup_casual'): 0.55,
-    ('mission_driven', 'formal_corporate'): 0.55,
-    ('formal_corporate', 'mission_driven'): 0.55,
-    ('academic_research', 'consulting_professional'): 0.55,
-    ('consulting_professional', 'academic_research'): 0.55,
+    frozenset({'startup_casual', 'formal_corporate'}): 0.55,
+    frozenset({'mission_driven', 'formal_corporate'}): 0.55,
+    frozenset({'academic_research', 'consulting_professional'}): 0.55,
 
     # Mismatched pairs (default 0.35)
 }
 
+# Score for tone pairs not listed in TONE_COMPATIBILITY
+DEFAULT_TONE_COMPATIBILITY = 0.35
+
+
+# Tone compliance notes by score band (first threshold reached wins)
+_TONE_NOTE_BANDS: Tuple[Tuple[float, str], ...] = (
+    (0.85, "Excellent tone alignment. Cover letter matches the {target} "
+           "style expected for this role."),
+    (0.70, "Good tone alignment. The {detected} style is compatible with "
+           "the expected {target} tone."),
+    (0.55, "Acceptable tone alignment. The {detected} style may slightly "
+           "differ from {target}, but remains professional."),
+    (float("-inf"), "Tone mismatch detected. The {detected} style may not align well "
+                    "with the expected {target} tone. Consider adjusting formality level."),
+)
+
+
+def get_tone_compatibility(target_tone: str, detected_tone: str) -> float:
+    """Return the compatibility score for a pair of tones (order-independent)."""
+    return TONE_COMPATIBILITY.get(
+        frozenset((target_tone, detected_tone)),
+        DEFAULT_TONE_COMPATIBILITY
+    )
+
+
+def _newline_offsets(text: str) -> List[int]:
+    """Return the index of every newline in text, in ascending order."""
+    offsets = []
+    pos = text.find('\n')
+    while pos != -1:
+        offsets.append(pos)
+        pos = text.find('\n', pos + 1)
+    return offsets
+
+
+def _section_for_line(line_idx: int, total_lines: int) -> str:
+    """Classify a line as greeting (first 3), closing (last 4), or body."""
+    if line_idx < 3:
+        return "greeting"
+    elif line_idx >= total_lines - 4:
+        return "closing"
+    return "body"
+
 
-def check_em_dashes(text: str) -> List[BannedPhraseViolation]:
+def check_em_dashes(
+    text: str,
+    newline_offsets: Optional[List[int]] = None
+) -> List[BannedPhraseViolation]:
     """
     Check for em-dashes in text (explicitly banned by style guide).
 
     Args:
         text: Text to check
+        newline_offsets: Optional precomputed _newline_offsets(text), so
+            callers that already have it skip rescanning the text
 
     Returns:
         List of BannedPhraseViolation for each em-dash found
     """
+    # Well-formed letters have none; a substring probe is cheaper than a scan
+    if '—' not in text:
+        return []
+
     violations = []
+    if newline_offsets is None:
+        newline_offsets = _newline_offsets(text)
+    total_lines = len(newline_offsets) + 1
 
-    for match in _EM_DASH_COMPILED.finditer(text):
+    for match in EM_DASH_RE.finditer(text):
         # Find which line this match is on
-        char_pos = match.start()
-        line_count = text[:char_pos].count('\n')
-
-        # Determine section
-        lines = text.split('\n')
-        if line_count < 3:
-            section = "greeting"
-        elif line_count >= len(lines) - 4:
-            section = "closing"
-        else:
-            section = "body"
+        line_idx = bisect_left(newline_offsets, match.start())
 
         violations.append(BannedPhraseViolation(
             phrase="em-dash (—)",
             severity="critical",
-            section=section
+            section=_section_for_line(line_idx, total_lines)
         ))
 
     return violations
@@ -310,7 +388,8 @@ def check_em_dashes(text: str) -> List[BannedPhraseViolation]:
 
 def check_banned_phrases(
     text: str,
-    company_name: Optional[str] = None
+    company_name: Optional[str] = None,
+    text_lower: Optional[str] = None
 ) -> BannedPhraseCheck:
     """
     Detect banned phrases in cover letter text.
@@ -320,59 +399,53 @@ def check_banned_phrases(
     Args:
         text: Cover letter text to check
         company_name: Company name if known (affects some checks)
+        text_lower: Optional precomputed text.lower(), so callers running
+            several checks on one draft lowercase it only once
 
     Returns:
         BannedPhraseCheck with violations and severity
     """
     violations: List[BannedPhraseViolation] = []
-    text_lower = text.lower()
+    if text_lower is None:
+        text_lower = text.lower()
+
+    # Line index of a match = number of newlines before it (via bisect)
+    newline_offsets = _newline_offsets(text)
+    total_lines = len(newline_offsets) + 1
 
     # Check for em-dashes first (style guide Section 2: Banned Punctuation)
-    em_dash_violations = check_em_dashes(text)
+    em_dash_violations = check_em_dashes(text, newline_offsets)
     violations.extend(em_dash_violations)
 
-    # Determine section boundaries (rough heuristics)
-    lines = text.split('\n')
-    greeting_end = min(3, len(lines))  # First 3 lines typically greeting
-    closing_start = max(0, len(lines) - 4)  # Last 4 lines typically closing
-
-    def get_section(line_idx: int) -> str:
-        if line_idx < greeting_end:
-            return "greeting"
-        elif line_idx >= closing_start:
-            return "closing"
-        return "body"
+    # Highest severity seen so far (em-dashes are always critical)
+    max_rank = _SEVERITY_RANK["critical"] if em_dash_violations else 0
 
     # Check each banned phrase using pre-compiled patterns
-    for phrase, severity in BANNED_PHRASES.items():
+    for phrase, severity, pattern in BANNED_PHRASE_PATTERNS:
+        # Cheap substring test first: most phrases never occur, and the
+        # boundary-checking regex scan is far slower than str.__contains__
+        if phrase not in text_lower:
+            continue
+
         # Special case: "dear hiring manager" is only major if company is known
         if phrase == "dear hiring manager" and not company_name:
             severity = "minor"  # Downgrade if company unknown
 
-        # Use pre-compiled pattern for performance
-        pattern = _BANNED_PHRASE_PATTERNS[phrase]
-
         for match in pattern.finditer(text_lower):
-            # Find which line this match is on
-            char_pos = match.start()
-            line_idx = text[:char_pos].count('\n')
-            section = get_section(line_idx)
+            # Find which line this match is on (first 3 lines are the
+            # greeting, last 4 the closing)
+            line_idx = bisect_left(newline_offsets, match.start())
+            section = _section_for_line(line_idx, total_lines)
 
             violations.append(BannedPhraseViolation(
                 phrase=phrase,
                 severity=severity,
                 section=section
             ))
+            max_rank = max(max_rank, _SEVERITY_RANK[severity])
 
     # Determine overall severity
-    if not violations:
-        overall_severity = "none"
-    elif any(v.severity == "critical" for v in violations):
-        overall_severity = "critical"
-    elif any(v.severity == "major" for v in violations):
-        overall_severity = "major"
-    else:
-        overall_severity = "minor"
+    overall_severity = _SEVERITY_LEVELS[max_rank]
 
     # Passed means no critical or major violations
     passed = overall_severity in ("none", "minor")
@@ -408,35 +481,16 @@ async def assess_tone_compliance(
     detected_tone = await llm.infer_tone(cover_letter_text)
 
     # Calculate compliance score from compatibility matrix
-    compliance_score = TONE_COMPATIBILITY.get(
-        (target_tone, detected_tone),
-        0.35  # Default for unknown combinations
-    )
+    compliance_score = get_tone_compatibility(target_tone, detected_tone)
 
     # Determine if tones are compatible (>= 0.55 threshold)
     compatible = compliance_score >= 0.55
 
-    # Generate explanatory notes
-    if compliance_score >= 0.85:
-        tone_notes = (
-            f"Excellent tone alignment. Cover letter matches the {target_tone} "
-            f"style expected for this role."
-        )
-    elif compliance_score >= 0.70:
-        tone_notes = (
-            f"Good tone alignment. The {detected_tone} style is compatible with "
-            f"the expected {target_tone} tone."
-        )
-    elif compliance_score >= 0.55:
-        tone_notes = (
-            f"Acceptable tone alignment. The {detected_tone} style may slightly "
-            f"differ from {target_tone}, but remains professional."
-        )
-    else:
-        tone_notes = (
-            f"Tone mismatch detected. The {detected_tone} style may not align well "
-            f"with the expected {target_tone} tone. Consider adjusting formality level."
-        )
+    # Generate explanatory notes from the first band the score reaches
+    tone_notes = next(
+        template for threshold, template in _TONE_NOTE_BANDS
+        if compliance_score >= threshold
+    ).format(target=target_tone, detected=detected_tone)
 
     return ToneComplianceResult(
         target_tone=target_tone,
@@ -447,9 +501,40 @@ async def assess_tone_compliance(
     )
 
 
+def _contains_phrase(text_lower: str, phrase_lower: str) -> bool:
+    """Check for a lowercased phrase at word boundaries in lowercased text.
+
+    The substring test rejects absent phrases (the common case) without
+    running the boundary regex at all.
+    """
+    return (
+        phrase_lower in text_lower
+        and _compile_phrase_pattern(phrase_lower).search(text_lower) is not None
+    )
+
+
+@lru_cache(maxsize=1)
+def _synonym_variants_by_skill() -> Dict[str, Tuple[str, ...]]:
+    """
+    Map each normalized skill name to the lowercased variants of its synonym group.
+
+    Every variant (canonical name and synonyms) of a SKILL_SYNONYMS group
+    points at the whole group; when a name appears in several groups, the
+    first group wins, matching the original linear scan.
+    """
+    index: Dict[str, Tuple[str, ...]] = {}
+    for canonical, synonyms in SKILL_SYNONYMS.items():
+        all_variants = [canonical] + synonyms
+        variants_lower = tuple(v.lower() for v in all_variants)
+        for variant in all_variants:
+            index.setdefault(normalize_skill(variant), variants_lower)
+    return index
+
+
 def analyze_ats_keyword_coverage(
     cover_letter_text: str,
-    job_profile: JobProfile
+    job_profile: JobProfile,
+    text_lower: Optional[str] = None
 ) -> ATSKeywordCoverage:
     """
     Analyze ATS keyword coverage in cover letter.
@@ -457,6 +542,7 @@ def analyze_ats_keyword_coverage(
     Args:
         cover_letter_text: Generated cover letter
         job_profile: Job profile with extracted skills
+        text_lower: Optional precomputed cover_letter_text.lower()
 
     Returns:
         ATSKeywordCoverage analysis
@@ -490,36 +576,24 @@ def analyze_ats_keyword_coverage(
         )
 
     # Convert cover letter to word set for matching
-    cover_letter_lower = cover_letter_text.lower()
+    cover_letter_lower = text_lower if text_lower is not None else cover_letter_text.lower()
 
     covered_keywords: List[str] = []
     missing_keywords: List[str] = []
 
-    # Import here to avoid circular import
-    from services.skill_gap import SKILL_SYNONYMS
+    synonym_index = _synonym_variants_by_skill()
 
     for keyword in keywords:
-        # Check direct match using phrase boundaries (compile once per keyword)
-        pattern = _compile_phrase_pattern(keyword.lower())
-        if pattern.search(cover_letter_lower):
+        # Check direct match using phrase boundaries
+        if _contains_phrase(cover_letter_lower, keyword.lower()):
             covered_keywords.append(keyword)
         else:
             # Check if any synonym of the keyword appears in the cover letter
             found_synonym = False
-            normalized_keyword = normalize_skill(keyword)
-
-            # Check if keyword is a canonical skill with synonyms
-            for canonical, synonyms in SKILL_SYNONYMS.items():
-                if normalized_keyword == normalize_skill(canonical) or \
-                   normalized_keyword in [normalize_skill(s) for s in synonyms]:
-                    # Check if any synonym appears in cover letter
-                    all_variants = [canonical] + synonyms
-                    for variant in all_variants:
-                        variant_pattern = _compile_phrase_pattern(variant.lower())
-                        if variant_pattern.search(cover_letter_lower):
-                            covered_keywords.append(keyword)
-                            found_synonym = True
-                            break
+            for variant_lower in synonym_index.get(normalize_skill(keyword), ()):
+                if _contains_phrase(cover_letter_lower, variant_lower):
+                    covered_keywords.append(keyword)
+                    found_synonym = True
                     break
 
             if not found_synonym:
@@ -547,6 +621,50 @@ def analyze_ats_keyword_coverage(
     )
 
 
+async def run_quality_checks(
+    cover_letter_text: str,
+    job_profile: JobProfile,
+    company_name: Optional[str],
+    llm: BaseLLM
+) -> Tuple[BannedPhraseCheck, ToneComplianceResult, ATSKeywordCoverage]:
+    """
+    Run the banned phrase, tone, and ATS checks on a draft concurrently.
+
+    The deterministic checks run in worker threads so they overlap with the
+    LLM tone inference instead of running before and after it. They are
+    listed first so they reach the thread pool before the tone call starts:
+    ClaudeLLM uses the synchronous Anthropic client, which blocks the event
+    loop for the whole request.
+
+    The ATS worker gets a plain snapshot of the job profile fields it reads,
+    never the ORM instance: touching an expired attribute from a worker thread
+    would make the shared Session reload it off the event loop thread.
+
+    Args:
+        cover_letter_text: Cover letter draft to check
+        job_profile: Target job profile
+        company_name: Company name, if known (affects greeting severity)
+        llm: LLM instance for tone inference
+
+    Returns:
+        Tuple of (banned phrase check, tone compliance, ATS keyword coverage)
+    """
+    text_lower = cover_letter_text.lower()
+    ats_fields = SimpleNamespace(
+        extracted_skills=job_profile.extracted_skills,
+        must_have_capabilities=job_profile.must_have_capabilities,
+        core_priorities=job_profile.core_priorities,
+    )
+    banned_check, ats_coverage, tone_compliance = await asyncio.gather(
+        asyncio.to_thread(check_banned_phrases, cover_letter_text, company_name, text_lower),
+        asyncio.to_thread(
+            analyze_ats_keyword_coverage, cover_letter_text, ats_fields, text_lower
+        ),
+        assess_tone_compliance(cover_letter_text, job_profile, llm),
+    )
+    return banned_check, tone_compliance, ats_coverage
+
+
 def generate_outline(
     job_profile: JobProfile,
     company_profile: Optional[CompanyProfile],
@@ -602,11 +720,11 @@ def generate_outline(
         top_skills = job_profile.key_skills[:3]
     else:
         # Fall back to skill gap analysis
-        top_skills = [m.skill for m in sorted(
+        top_skills = [m.skill for m in heapq.nlargest(
+            3,
             skill_gap_result.matched_skills,
-            key=lambda x: x.match_strength,
-            reverse=True
-        )[:3]]  # Get top 3 skills
+            key=attrgetter('match_strength')
+        )]  # Get top 3 skills
 
     if top_skills:
         if len(top_skills) >= 3:
@@ -635,15 +753,18 @@ def generate_outline(
     # Highlight top matched skills with evidence - as SEPARATE SENTENCES
     value_sentences = []
 
+    # Lowercase matched skill names once for the lookups below
+    matched_lower = [(m, m.skill.lower()) for m in skill_gap_result.matched_skills]
+
     # Sprint 10E: Use key_skills for evidence if available
     skills_to_highlight = []
     if job_profile.key_skills and len(job_profile.key_skills) >= 2:
-        # Find matched_skills that correspond to key_skills
+        # Find matched_skills that correspond to key_skills (first match wins)
+        matched_by_skill: Dict[str, SkillMatch] = {}
+        for m, skill_lower in matched_lower:
+            matched_by_skill.setdefault(skill_lower, m)
         for key_skill in job_profile.key_skills[:3]:
-            match = next(
-                (m for m in skill_gap_result.matched_skills if m.skill.lower() == key_skill.lower()),
-                None
-            )
+            match = matched_by_skill.get(key_skill.lower())
             if match:
                 skills_to_highlight.append(match)
 
@@ -687,14 +808,17 @@ def generate_outline(
     effective_company_name = company_name
     if not effective_company_name and job_profile.raw_jd_text:
         # Try to extract company name from common patterns in JD
-        jd_lower = job_profile.raw_jd_text.lower()
-        if ' at ' in jd_lower:
-            # Pattern: "Role at Company"
-            parts = job_profile.raw_jd_text.split(' at ')
-            if len(parts) > 1:
-                potential_company = parts[1].split(',')[0].split('.')[0].strip()
-                if len(potential_company) > 2 and len(potential_company) < 50:
-                    effective_company_name = potential_company
+        # Pattern: "Role at Company" - take the text between the first and
+        # second " at " without lowercasing or splitting the whole JD
+        jd_text = job_profile.raw_jd_text
+        at_pos = jd_text.find(' at ')
+        if at_pos != -1:
+            segment_start = at_pos + 4
+            segment_end = jd_text.find(' at ', segment_start)
+            segment = jd_text[segment_start:segment_end if segment_end != -1 else None]
+            potential_company = segment.split(',')[0].split('.')[0].strip()
+            if len(potential_company) > 2 and len(potential_company) < 50:
+                effective_company_name = potential_company
 
     # Company-specific alignment
     if company_profile:
@@ -734,8 +858,8 @@ def generate_outline(
         # Find requirements that match user's skills
         for cap in job_profile.must_have_capabilities[:5]:
             cap_lower = cap.lower()
-            for match in skill_gap_result.matched_skills:
-                if match.skill.lower() in cap_lower or cap_lower in match.skill.lower():
+            for match, skill_lower in matched_lower:
+                if skill_lower in cap_lower or cap_lower in skill_lower:
                     alignment_parts.append(
                         f"My background in {match.skill} directly addresses your need for {smart_truncate(cap, 60).lower()}."
                     )
@@ -844,7 +968,7 @@ def build_rationale(
     customization_parts = []
 
     if skill_gap_result.matched_skills:
-        top_match = max(skill_gap_result.matched_skills, key=lambda m: m.match_strength)
+        top_match = max(skill_gap_result.matched_skills, key=attrgetter('match_strength'))
         customization_parts.append(f"Led with strongest skill match: {top_match.skill}")
 
     if skill_gap_result.weak_signals:
@@ -871,6 +995,10 @@ def build_rationale(
     )
 
 
+# Quality score penalty per banned phrase violation, by severity
+_SEVERITY_PENALTY: Dict[str, float] = {"critical": 15.0, "major": 8.0, "minor": 2.0}
+
+
 def compute_quality_score(
     banned_check: BannedPhraseCheck,
     tone_compliance: ToneComplianceResult,
@@ -895,18 +1023,11 @@ def compute_quality_score(
     # ATS coverage component (max +20)
     ats_points = (ats_coverage.coverage_percentage / 100.0) * 20.0
 
-    # Banned phrase penalty
-    banned_penalty = 0.0
-    for violation in banned_check.violations:
-        if violation.severity == "critical":
-            banned_penalty += 15.0
-        elif violation.severity == "major":
-            banned_penalty += 8.0
-        elif violation.severity == "minor":
-            banned_penalty += 2.0
-
-    # Cap penalty at 40 points (don't go below 10)
-    banned_penalty = min(banned_penalty, 40.0)
+    # Banned phrase penalty, capped at 40 points (don't go below 10)
+    banned_penalty = min(
+        sum(_SEVERITY_PENALTY.get(v.severity, 0.0) for v in banned_check.violations),
+        40.0
+    )
 
     # Bonus for no violations (+10)
     if banned_check.violations_found == 0:
@@ -965,9 +1086,9 @@ async def evaluate_cover_letter(
     company_name = company_profile.name if company_profile else None
 
     # Run quality checks
-    banned_check = check_banned_phrases(cover_letter_text, company_name)
-    tone_compliance = await assess_tone_compliance(cover_letter_text, job_profile, llm)
-    ats_coverage = analyze_ats_keyword_coverage(cover_letter_text, job_profile)
+    banned_check, tone_compliance, ats_coverage = await run_quality_checks(
+        cover_letter_text, job_profile, company_name, llm
+    )
 
     # Compute quality score
     quality_score = compute_quality_score(banned_check, tone_compliance, ats_coverage)
@@ -1086,7 +1207,8 @@ async def evaluate_cover_letter(
 
 def analyze_requirement_coverage(
     cover_letter_text: str,
-    job_profile: JobProfile
+    job_profile: JobProfile,
+    text_lower: Optional[str] = None
 ) -> List[RequirementCoverage]:
     """
     Analyze how well the cover letter addresses top job requirements.
@@ -1096,12 +1218,14 @@ def analyze_requirement_coverage(
     Args:
         cover_letter_text: Generated cover letter text
         job_profile: Job profile with core_priorities and must_have_capabilities
+        text_lower: Optional precomputed cover_letter_text.lower()
 
     Returns:
         List of RequirementCoverage objects for top requirements
     """
     requirements_covered = []
-    text_lower = cover_letter_text.lower()
+    if text_lower is None:
+        text_lower = cover_letter_text.lower()
 
     # Get top requirements from job profile
     top_requirements = []
@@ -1121,19 +1245,18 @@ def analyze_requirement_coverage(
 
     for requirement in top_requirements:
         req_lower = requirement.lower()
+        # Significant words, shared by the overlap check and the evidence search
+        req_words = [w for w in req_lower.split() if len(w) >= 3]
 
         # First try exact phrase match with word boundaries
-        phrase_pattern = _compile_phrase_pattern(req_lower)
-        covered = bool(phrase_pattern.search(text_lower))
+        covered = _contains_phrase(text_lower, req_lower)
 
         # If no exact match, check for significant word overlap with word boundaries
         if not covered:
-            req_words = [w for w in req_lower.split() if len(w) >= 3]
             if req_words:
                 matching_count = 0
                 for word in req_words:
-                    word_pattern = _compile_phrase_pattern(word)
-                    if word_pattern.search(text_lower):
+                    if _contains_phrase(text_lower, word):
                         matching_count += 1
                 # Require at least 60% of significant words to match
                 covered = matching_count >= len(req_words) * 0.6
@@ -1141,16 +1264,35 @@ def analyze_requirement_coverage(
         # Find evidence sentence if covered
         evidence = None
         if covered:
-            sentences = cover_letter_text.replace('\n', ' ').split('.')
-            for sentence in sentences:
-                sentence_lower = sentence.lower()
-                # Look for the sentence containing the requirement words
-                req_words = [w for w in req_lower.split() if len(w) >= 3]
-                if any(w in sentence_lower for w in req_words[:2]):
-                    evidence = sentence.strip()[:150]
-                    if evidence and not evidence.endswith('.'):
-                        evidence += "..."
-                    break
+            sentence = None
+            if len(text_lower) == len(cover_letter_text):
+                # The first sentence containing either of the first two
+                # requirement words is the one holding the earliest hit. Words
+                # with a '.' can never sit inside a single sentence, so they are
+                # skipped. Offsets into text_lower are only valid for the
+                # original text when lower() kept its length (it does not for
+                # e.g. 'İ').
+                hits = [
+                    pos for pos in (
+                        text_lower.find(w) for w in req_words[:2] if '.' not in w
+                    )
+                    if pos != -1
+                ]
+                if hits:
+                    hit = min(hits)
+                    start = text_lower.rfind('.', 0, hit) + 1
+                    end = text_lower.find('.', hit)
+                    sentence = cover_letter_text[start:end if end != -1 else None]
+            else:
+                for candidate in cover_letter_text.split('.'):
+                    candidate_lower = candidate.lower()
+                    if any(w in candidate_lower for w in req_words[:2]):
+                        sentence = candidate
+                        break
+            if sentence is not None:
+                evidence = sentence.replace('\n', ' ').strip()[:150]
+                if evidence and not evidence.endswith('.'):
+                    evidence += "..."
 
         requirements_covered.append(RequirementCoverage(
             requirement=requirement,
@@ -1163,7 +1305,8 @@ def analyze_requirement_coverage(
 
 def generate_mission_alignment_summary(
     cover_letter_text: str,
-    company_profile: Optional[CompanyProfile]
+    company_profile: Optional[CompanyProfile],
+    text_lower: Optional[str] = None
 ) -> Optional[str]:
     """
     Generate summary of how the letter aligns with company mission/positioning.
@@ -1173,6 +1316,7 @@ def generate_mission_alignment_summary(
     Args:
         cover_letter_text: Generated cover letter text
         company_profile: Company profile with mission, known_initiatives, culture_signals
+        text_lower: Optional precomputed cover_letter_text.lower()
 
     Returns:
         Summary string or None if no company profile
@@ -1181,7 +1325,8 @@ def generate_mission_alignment_summary(
         return None
 
     alignment_parts = []
-    text_lower = cover_letter_text.lower()
+    if text_lower is None:
+        text_lower = cover_letter_text.lower()
 
     # Check if company name is mentioned
     if company_profile.name and company_profile.name.lower() in text_lower:
@@ -1189,7 +1334,8 @@ def generate_mission_alignment_summary(
 
     # Check for mission/initiative keywords
     if company_profile.known_initiatives:
-        initiative_words = company_profile.known_initiatives.lower().split()[:5]
+        # Only the first five words are used; stop splitting after them
+        initiative_words = company_profile.known_initiatives.lower().split(None, 5)[:5]
         matched = [w for w in initiative_words if len(w) > 4 and w in text_lower]
         if matched:
             alignment_parts.append(f"Addresses company initiatives ({', '.join(matched[:3])})")
@@ -1207,6 +1353,11 @@ def generate_mission_alignment_summary(
         return "Company positioning not explicitly addressed in cover letter."
 
 
+# Newlines and tabs are allowed in context notes despite not being printable;
+# this table drops them before the isprintable() fast-path check
+_NOTE_WHITESPACE_TABLE = str.maketrans('', '', '\n\t')
+
+
 async def generate_cover_letter(
     job_profile_id: int,
     user_id: int,
@@ -1251,12 +1402,12 @@ async def generate_cover_letter(
         llm = create_llm()
 
     # Fetch user
-    user = db.query(User).filter(User.id == user_id).first()
+    user = db.get(User, user_id)
     if not user:
         raise ValueError(f"User {user_id} not found")
 
     # Fetch job profile
-    job_profile = db.query(JobProfile).filter(JobProfile.id == job_profile_id).first()
+    job_profile = db.get(JobProfile, job_profile_id)
     if not job_profile:
         raise ValueError(f"Job profile {job_profile_id} not found")
 
@@ -1270,9 +1421,7 @@ async def generate_cover_letter(
     # Fetch company profile if provided
     company_profile: Optional[CompanyProfile] = None
     if company_profile_id:
-        company_profile = db.query(CompanyProfile).filter(
-            CompanyProfile.id == company_profile_id
-        ).first()
+        company_profile = db.get(CompanyProfile, company_profile_id)
         if not company_profile:
             raise ValueError(f"Company profile {company_profile_id} not found")
 
@@ -1362,8 +1511,12 @@ async def generate_cover_letter(
     if context_notes:
         # Strip whitespace and enforce max length
         sanitized_context_notes = context_notes.strip()[:2000]
-        # Remove any control characters
-        sanitized_context_notes = ''.join(c for c in sanitized_context_notes if c.isprintable() or c in '\n\t')
+        # Remove any control characters. Typical notes are entirely printable,
+        # which one C-level isprintable() call confirms without a per-char loop
+        if not sanitized_context_notes.translate(_NOTE_WHITESPACE_TABLE).isprintable():
+            sanitized_context_notes = ''.join(
+                c for c in sanitized_context_notes if c.isprintable() or c in '\n\t'
+            )
 
     # Build examples context from approved paragraphs (Sprint 8B.2)
     examples_context = ""
@@ -1388,13 +1541,15 @@ async def generate_cover_letter(
 
     # Generate initial cover letter draft
     target_tone = job_profile.tone_style or "formal_corporate"
+    # Revisions get the same outline so the LLM can reuse the cached context
+    outline_context = {
+        "introduction": outline.introduction,
+        "value_proposition": outline.value_proposition,
+        "alignment": outline.alignment,
+        "call_to_action": outline.call_to_action,
+    }
     draft = await llm.generate_cover_letter(
-        outline={
-            "introduction": outline.introduction,
-            "value_proposition": outline.value_proposition,
-            "alignment": outline.alignment,
-            "call_to_action": outline.call_to_action,
-        },
+        outline=outline_context,
         job_context=job_context,
         company_context=company_context,
         tone=target_tone,
@@ -1455,16 +1610,23 @@ async def generate_cover_letter(
         }
 
         # Request revision from LLM
-        current_draft = await llm.revise_cover_letter(
+        revised_draft = await llm.revise_cover_letter(
             current_draft=current_draft,
             critic_feedback=critic_feedback,
             job_context=job_context,
             company_context=company_context,
             tone=target_tone,
             user_name=user.full_name,
-            max_words=265  # Target: 250-275 words
+            max_words=265,  # Target: 250-275 words
+            outline=outline_context
         )
 
+        if revised_draft == current_draft:
+            # LLM made no changes: re-evaluating would only repeat this
+            # iteration's checks (including the tone LLM call)
+            break
+
+        current_draft = revised_draft
         previous_result = critic_result
 
     # =============================================
@@ -1483,9 +1645,9 @@ async def generate_cover_letter(
     else:
         # Fallback if no critic run (shouldn't happen)
         company_name = company_profile.name if company_profile else None
-        banned_check = check_banned_phrases(current_draft, company_name)
-        tone_compliance = await assess_tone_compliance(current_draft, job_profile, llm)
-        ats_coverage = analyze_ats_keyword_coverage(current_draft, job_profile)
+        banned_check, tone_compliance, ats_coverage = await run_quality_checks(
+            current_draft, job_profile, company_name, llm
+        )
         quality_score = compute_quality_score(banned_check, tone_compliance, ats_coverage)
         critic_passed = quality_score >= quality_threshold
 
@@ -1499,10 +1661,15 @@ async def generate_cover_letter(
     )
 
     # Analyze requirement coverage (style guide Section 6)
-    requirements_covered = analyze_requirement_coverage(current_draft, job_profile)
+    draft_lower = current_draft.lower()
+    requirements_covered = analyze_requirement_coverage(
+        current_draft, job_profile, draft_lower
+    )
 
     # Generate mission alignment summary (style guide Section 6)
-    mission_alignment_summary = generate_mission_alignment_summary(current_draft, company_profile)
+    mission_alignment_summary = generate_mission_alignment_summary(
+        current_draft, company_profile, draft_lower
+    )
 
     # Extract ATS keywords used
     ats_keywords_used = ats_coverage.covered_keywords
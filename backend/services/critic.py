@@ -7,7 +7,7 @@ ATS compliance, banned phrase detection, tone matching, and rule enforcement.
 
 import re
 from datetime import datetime
-from typing import Any, Dict, List, Literal, Optional, Tuple
+from typing import Any, Dict, Iterable, List, Literal, Optional, Tuple
 from sqlalchemy.orm import Session
 
 from db.models import Experience, JobProfile
@@ -22,11 +22,12 @@ from schemas.critic import (
     StyleScoreBreakdown,
 )
 from services.cover_letter import (
-    BANNED_PHRASES,
+    BANNED_PHRASE_PATTERNS,
     EM_DASH_PATTERN,
-    TONE_COMPATIBILITY,
+    EM_DASH_RE,
     analyze_ats_keyword_coverage,
     analyze_requirement_coverage,
+    get_tone_compatibility,
 )
 from services.llm.base import BaseLLM
 from services.llm.mock_llm import MockLLM
@@ -78,7 +79,7 @@ BANNED_PHRASE_FIXES = {
 # =============================================================================
 
 # Strong action verbs for lexical analysis (preferred)
-STRONG_VERBS = {
+STRONG_VERBS = frozenset({
     "lead", "led", "build", "built", "deliver", "delivered", "drive", "drove",
     "implement", "implemented", "architect", "architected", "design", "designed",
     "establish", "established", "scale", "scaled", "transform", "transformed",
@@ -89,41 +90,41 @@ STRONG_VERBS = {
     "strategized", "streamline", "streamlined", "pioneer", "pioneered",
     "accelerate", "accelerated", "modernize", "modernized", "negotiate",
     "negotiated", "secure", "secured", "champion", "championed",
-}
+})
 
 # Weak verbs that should be avoided (flagged)
-WEAK_VERBS = {
+WEAK_VERBS = frozenset({
     "helped", "help", "assisted", "assist", "worked on", "working on",
     "was responsible for", "responsible for", "contributed to", "contribute to",
     "participated in", "participate in", "involved in", "involve in",
     "supported", "support", "was part of", "part of", "handled", "handle",
     "dealt with", "deal with", "took care of", "take care of",
-}
+})
 
 # Filler words to flag (reduce quality)
-FILLER_WORDS = {
+FILLER_WORDS = frozenset({
     "really", "very", "quite", "just", "actually", "basically",
     "literally", "simply", "essentially", "generally", "practically",
     "kind of", "sort of", "somewhat", "rather", "fairly",
-}
+})
 
 # Emotional opening phrases (critical violations)
-EMOTIONAL_OPENINGS = {
+EMOTIONAL_OPENINGS = frozenset({
     "i'm thrilled", "i'm excited to", "i'm delighted",
     "i am thrilled", "i am excited to", "i am delighted",
     "it is with great excitement", "i'm passionate about",
     "i am passionate about", "i'm eager to", "i am eager to",
     "i'm enthusiastic", "i am enthusiastic",
-}
+})
 
 # Generic value statements (critical violations)
-GENERIC_STATEMENTS = {
+GENERIC_STATEMENTS = frozenset({
     "fast-paced environment", "dynamic professional",
     "results-oriented professional", "proven track record",
     "team player", "self-starter", "go-getter",
     "hard worker", "motivated individual", "driven professional",
     "detail-oriented professional", "highly motivated",
-}
+})
 
 # Style score thresholds
 STYLE_SCORE_THRESHOLD = 85
@@ -155,6 +156,35 @@ BAD_CLOSING_PATTERNS = [
     r"i hope to hear from you",
 ]
 
+# Opening/closing checks only need to know whether any pattern matches, so
+# each list is one alternation (patterns are applied to lowercased text)
+_BAD_OPENING_RE = re.compile("|".join(BAD_OPENING_PATTERNS))
+_BAD_CLOSING_RE = re.compile("|".join(BAD_CLOSING_PATTERNS))
+
+
+def _compile_word_patterns(words: Iterable[str]) -> Tuple[Tuple[str, re.Pattern], ...]:
+    """Compile a whole-word, case-insensitive pattern for each lexicon entry."""
+    return tuple(
+        (word, re.compile(r'\b' + re.escape(word) + r'\b', re.IGNORECASE))
+        for word in words
+    )
+
+
+# Style lexicons compiled once at import: (word_or_phrase, pattern)
+_STRONG_VERB_PATTERNS = _compile_word_patterns(STRONG_VERBS)
+_WEAK_VERB_PATTERNS = _compile_word_patterns(WEAK_VERBS)
+_FILLER_WORD_PATTERNS = _compile_word_patterns(FILLER_WORDS)
+
+
+def _snippet(text: str, start: int, end: int, pad: int = 20) -> str:
+    """Quote text[start:end] with up to `pad` characters of context per side.
+
+    Truncated sides are marked with "...".
+    """
+    lo = max(0, start - pad)
+    hi = min(len(text), end + pad)
+    return f"{'...' if lo else ''}{text[lo:hi]}{'...' if hi < len(text) else ''}"
+
 
 def check_em_dashes(
     text: str,
@@ -172,21 +202,15 @@ def check_em_dashes(
     Returns:
         List of CriticIssue objects for each em-dash found
     """
-    if not text:
+    # Clean text (the common case) needs no regex scan at all
+    if not text or '—' not in text:
         return []
 
     issues: List[CriticIssue] = []
-    pattern = re.compile(EM_DASH_PATTERN)
 
-    for match in pattern.finditer(text):
+    for match in EM_DASH_RE.finditer(text):
         # Get surrounding context
-        start = max(0, match.start() - 20)
-        end = min(len(text), match.end() + 20)
-        snippet = text[start:end]
-        if start > 0:
-            snippet = "..." + snippet
-        if end < len(text):
-            snippet = snippet + "..."
+        snippet = _snippet(text, match.start(), match.end())
 
         issues.append(CriticIssue(
             issue_type="em_dash_violation",
@@ -223,26 +247,20 @@ def check_banned_phrases(
     issues: List[CriticIssue] = []
     text_lower = text.lower()
 
-    for phrase, severity in BANNED_PHRASES.items():
+    # Shared with the cover letter checker: (phrase, severity, pattern), where
+    # the patterns are case-sensitive and match against lowercased text
+    for phrase, severity, pattern in BANNED_PHRASE_PATTERNS:
+        # Most phrases never occur; a substring test skips their regex scan
+        if phrase not in text_lower:
+            continue
+
         # Special case: "dear hiring manager" is only major if company is known
         if phrase == "dear hiring manager" and not company_name:
             severity = "minor"
 
-        # Use lookahead/lookbehind for phrase boundaries
-        pattern = re.compile(
-            r'(?<![a-zA-Z])' + re.escape(phrase) + r'(?![a-zA-Z])',
-            re.IGNORECASE
-        )
-
         for match in pattern.finditer(text_lower):
             # Get surrounding context for original_text
-            start = max(0, match.start() - 20)
-            end = min(len(text), match.end() + 20)
-            snippet = text[start:end]
-            if start > 0:
-                snippet = "..." + snippet
-            if end < len(text):
-                snippet = snippet + "..."
+            snippet = _snippet(text, match.start(), match.end())
 
             # Get recommended fix
             recommended_fix = BANNED_PHRASE_FIXES.get(
@@ -333,13 +351,7 @@ def detect_passive_voice(text: str) -> Tuple[float, List[str]]:
             # Get snippet around the passive construction
             match = passive_pattern.search(sentence)
             if match and len(examples) < 3:
-                start = max(0, match.start() - 20)
-                end = min(len(sentence), match.end() + 20)
-                snippet = sentence[start:end]
-                if start > 0:
-                    snippet = "..." + snippet
-                if end < len(sentence):
-                    snippet = snippet + "..."
+                snippet = _snippet(sentence, match.start(), match.end())
                 examples.append(snippet)
 
     passive_rate = passive_sentences / len(sentences) if sentences else 0.0
@@ -371,13 +383,7 @@ def detect_emotional_adjectives(text: str) -> List[Tuple[str, str]]:
     for adj in emotional_adjectives:
         pattern = re.compile(r'\b' + re.escape(adj) + r'\b', re.IGNORECASE)
         for match in pattern.finditer(text_lower):
-            start = max(0, match.start() - 15)
-            end = min(len(text), match.end() + 15)
-            snippet = text[start:end]
-            if start > 0:
-                snippet = "..." + snippet
-            if end < len(text):
-                snippet = snippet + "..."
+            snippet = _snippet(text, match.start(), match.end(), pad=15)
             found.append((adj, snippet))
 
     return found
@@ -469,26 +475,20 @@ def check_verb_strength(text: str) -> Tuple[int, float, List[CriticIssue]]:
     strong_count = 0
     weak_count = 0
 
-    # Check for strong verbs
-    for verb in STRONG_VERBS:
-        pattern = re.compile(r'\b' + re.escape(verb) + r'\b', re.IGNORECASE)
-        matches = pattern.findall(text_lower)
-        strong_count += len(matches)
+    # Check for strong verbs (substring test first: most never occur)
+    for verb, pattern in _STRONG_VERB_PATTERNS:
+        if verb in text_lower:
+            strong_count += len(pattern.findall(text_lower))
 
     # Check for weak verbs
     weak_found = []
-    for phrase in WEAK_VERBS:
-        pattern = re.compile(r'\b' + re.escape(phrase) + r'\b', re.IGNORECASE)
+    for phrase, pattern in _WEAK_VERB_PATTERNS:
+        if phrase not in text_lower:
+            continue
         for match in pattern.finditer(text_lower):
             weak_count += 1
             if len(weak_found) < 5:  # Limit examples
-                start = max(0, match.start() - 20)
-                end = min(len(text), match.end() + 20)
-                snippet = text[start:end]
-                if start > 0:
-                    snippet = "..." + snippet
-                if end < len(text):
-                    snippet = snippet + "..."
+                snippet = _snippet(text, match.start(), match.end())
                 weak_found.append((phrase, snippet))
 
     # Calculate rates
@@ -543,20 +543,15 @@ def check_filler_words(text: str) -> List[CriticIssue]:
     filler_counts: Dict[str, int] = {}
     filler_examples: Dict[str, str] = {}
 
-    for filler in FILLER_WORDS:
-        pattern = re.compile(r'\b' + re.escape(filler) + r'\b', re.IGNORECASE)
+    for filler, pattern in _FILLER_WORD_PATTERNS:
+        if filler not in text_lower:
+            continue
         matches = list(pattern.finditer(text_lower))
         if matches:
             filler_counts[filler] = len(matches)
             # Get one example snippet for the first occurrence
             match = matches[0]
-            start = max(0, match.start() - 20)
-            end = min(len(text), match.end() + 20)
-            snippet = text[start:end]
-            if start > 0:
-                snippet = "..." + snippet
-            if end < len(text):
-                snippet = snippet + "..."
+            snippet = _snippet(text, match.start(), match.end())
             filler_examples[filler] = snippet
 
     # Create aggregated issues (limit to 5 total)
@@ -790,18 +785,16 @@ def check_cover_letter_structure_enhanced(
     opening = paragraphs[0] if paragraphs else ""
     opening_lower = opening.lower()
 
-    for pattern in BAD_OPENING_PATTERNS:
-        if re.search(pattern, opening_lower):
-            structure_details["has_value_opening"] = False
-            issues.append(CriticIssue(
-                issue_type="structure_gap_violation",
-                severity="error",
-                section="opening",
-                message="Opening is not value-oriented (uses generic intro pattern)",
-                original_text=opening[:100] + "..." if len(opening) > 100 else opening,
-                recommended_fix="Start with a compelling qualification or achievement, not a generic introduction"
-            ))
-            break
+    if _BAD_OPENING_RE.search(opening_lower):
+        structure_details["has_value_opening"] = False
+        issues.append(CriticIssue(
+            issue_type="structure_gap_violation",
+            severity="error",
+            section="opening",
+            message="Opening is not value-oriented (uses generic intro pattern)",
+            original_text=opening[:100] + "..." if len(opening) > 100 else opening,
+            recommended_fix="Start with a compelling qualification or achievement, not a generic introduction"
+        ))
 
     # 2. Check JD requirement alignment
     # Use existing requirements_covered data if available
@@ -874,18 +867,16 @@ def check_cover_letter_structure_enhanced(
     closing = paragraphs[-1] if paragraphs else ""
     closing_lower = closing.lower()
 
-    for pattern in BAD_CLOSING_PATTERNS:
-        if re.search(pattern, closing_lower):
-            structure_details["has_impact_closing"] = False
-            issues.append(CriticIssue(
-                issue_type="structure_gap_violation",
-                severity="error",
-                section="closing",
-                message="Closing is not impact-oriented (uses generic closing pattern)",
-                original_text=closing[:100] + "..." if len(closing) > 100 else closing,
-                recommended_fix="End with a value proposition or confident statement about your contribution"
-            ))
-            break
+    if _BAD_CLOSING_RE.search(closing_lower):
+        structure_details["has_impact_closing"] = False
+        issues.append(CriticIssue(
+            issue_type="structure_gap_violation",
+            severity="error",
+            section="closing",
+            message="Closing is not impact-oriented (uses generic closing pattern)",
+            original_text=closing[:100] + "..." if len(closing) > 100 else closing,
+            recommended_fix="End with a value proposition or confident statement about your contribution"
+        ))
 
     # Calculate structure score
     # Missing any section = 0 (auto-fail)
@@ -1037,10 +1028,7 @@ async def check_tone(
     detected_tone = await llm.infer_tone(text)
 
     # Check compatibility
-    compatibility_score = TONE_COMPATIBILITY.get(
-        (expected_tone, detected_tone),
-        0.35  # Default for unknown combinations
-    )
+    compatibility_score = get_tone_compatibility(expected_tone, detected_tone)
 
     if compatibility_score < 0.55:
         content_label = "resume" if content_type == "resume" else "cover letter"
@@ -19,7 +19,7 @@ from schemas.capability import (
     CapabilityClusterAnalysis,
     EvidenceMapping
 )
-from services.capability_ontology import CAPABILITY_ONTOLOGY
+from services.capability_ontology import CAPABILITY_ONTOLOGY, get_cluster_evidence_keywords
 
 logger = logging.getLogger(__name__)
 
@@ -223,8 +223,7 @@ def map_bullets_to_cluster(
     # Check ontology for additional keywords
     if cluster.name in CAPABILITY_ONTOLOGY:
         ontology_data = CAPABILITY_ONTOLOGY[cluster.name]
-        for kw in ontology_data.get("evidence_keywords", []):
-            cluster_keywords.add(kw.lower())
+        cluster_keywords.update(get_cluster_evidence_keywords(cluster.name))
         # Also add component skills from ontology
         for comp_skill in ontology_data.get("component_skills", []):
             cluster_keywords.add(comp_skill.lower())
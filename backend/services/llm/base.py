@@ -6,7 +6,7 @@ and skill-gap analysis.
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Dict
+from typing import List, Dict, Optional
 
 
 class BaseLLM(ABC):
@@ -105,7 +105,8 @@ class BaseLLM(ABC):
         company_context: Dict,
         tone: str,
         user_name: str,
-        max_words: int = 300
+        max_words: int = 300,
+        outline: Optional[Dict] = None
     ) -> str:
         """
         Revise a cover letter draft based on critic feedback.
@@ -121,6 +122,7 @@ class BaseLLM(ABC):
             tone: Target tone style
             user_name: User's full name for signature
             max_words: Target word count
+            outline: Outline the draft was generated from, if available
 
         Returns:
             Revised cover letter text
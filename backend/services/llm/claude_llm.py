@@ -7,7 +7,7 @@ Implements the style guide rules directly in the prompts for coherent output.
 
 import os
 import logging
-from typing import List, Dict
+from typing import List, Dict, Optional
 
 import anthropic
 
@@ -98,6 +98,101 @@ Led, Built, Developed, Designed, Created, Supported, Strengthened, Modernized, E
 Assisted, Participated, Contributed to, Was responsible for, Played a role in, Demonstrated
 """
 
+def _cover_letter_context(
+    outline: Optional[Dict],
+    job_context: Dict,
+    company_context: Dict,
+    tone: str
+) -> str:
+    """
+    Render the per-generation context shared by generate and revise calls.
+
+    Built only from inputs that stay fixed across the critic loop, so every
+    call for one cover letter renders identical text.
+    """
+    outline = outline or {}
+    company_name = company_context.get('name') or 'the company'
+    job_title = job_context.get('title') or 'the position'
+
+    # Format skills and priorities
+    skills = job_context.get('skills', [])
+    priorities = job_context.get('priorities', [])
+    must_have = job_context.get('must_have', [])
+
+    # Format company info
+    initiatives = company_context.get('initiatives') or ''
+    culture = company_context.get('culture') or []
+    referral_name = company_context.get('referral_name')
+    context_notes = company_context.get('context_notes') or ''
+    examples_context = company_context.get('examples_context') or ''
+
+    # Build evidence from outline (these come from resume bullets)
+    value_prop = outline.get('value_proposition', '')
+    alignment = outline.get('alignment', '')
+
+    return f"""# COVER LETTER CONTEXT: Benjamin Black for the {job_title} position at {company_name}
+
+## TARGET TONE: {tone}
+
+## JOB REQUIREMENTS:
+- Key Skills Needed: {', '.join(skills[:10]) if skills else 'See priorities below'}
+- Core Priorities: {', '.join(priorities[:5]) if priorities else 'General alignment with role'}
+- Must-Have Capabilities: {', '.join(must_have[:5]) if must_have else 'See skills above'}
+
+## COMPANY CONTEXT:
+- Company: {company_name}
+- Known Initiatives: {initiatives if initiatives else 'Research and reference their specific mission'}
+- Culture Signals: {', '.join(culture) if culture else 'Professional environment'}
+
+## BENJAMIN'S RELEVANT BACKGROUND (use this to write authentic content):
+{value_prop}
+
+{alignment}
+
+## ADDITIONAL CONTEXT:
+{f'Referral: This application is via referral from {referral_name}. Mention this naturally in the opening.' if referral_name else ''}
+{f'User Notes: {context_notes}' if context_notes else ''}
+
+{f'## EXAMPLE APPROVED PARAGRAPHS (for style reference):{chr(10)}{examples_context}' if examples_context else ''}"""
+
+
+def _cover_letter_system_blocks(
+    outline: Optional[Dict],
+    job_context: Dict,
+    company_context: Dict,
+    tone: str
+) -> List[Dict]:
+    """
+    Build the system blocks for a cover letter call.
+
+    The style guide prompt and the per-generation context form a prefix that
+    generate_cover_letter and every revise_cover_letter iteration send
+    unchanged, so the cache_control marker on the last block lets later calls
+    read the whole prefix from Anthropic's prompt cache. Only the draft and
+    critic feedback go in the user message.
+    """
+    return [
+        {"type": "text", "text": COVER_LETTER_SYSTEM_PROMPT},
+        {
+            "type": "text",
+            "text": _cover_letter_context(outline, job_context, company_context, tone),
+            "cache_control": {"type": "ephemeral"},
+        },
+    ]
+
+
+def _log_cache_usage(message, operation: str) -> None:
+    """Log prompt cache reads/writes reported for a cover letter call."""
+    usage = getattr(message, "usage", None)
+    if usage is None:
+        return
+    logger.debug(
+        f"{operation} prompt cache: "
+        f"read={getattr(usage, 'cache_read_input_tokens', None) or 0} "
+        f"written={getattr(usage, 'cache_creation_input_tokens', None) or 0} "
+        f"uncached={getattr(usage, 'input_tokens', None) or 0}"
+    )
+
 
 class ClaudeLLM(BaseLLM):
     """
@@ -199,51 +294,11 @@ Return only the category name, nothing else."""
         Unlike the heuristic approach, Claude sees all context at once and
         generates a flowing narrative without repetition.
         """
-        # Build the user prompt with all context
         company_name = company_context.get('name') or 'the company'
         job_title = job_context.get('title') or 'the position'
 
-        # Format skills and priorities
-        skills = job_context.get('skills', [])
-        priorities = job_context.get('priorities', [])
-        must_have = job_context.get('must_have', [])
-
-        # Format company info
-        initiatives = company_context.get('initiatives') or ''
-        culture = company_context.get('culture') or []
-        referral_name = company_context.get('referral_name')
-        context_notes = company_context.get('context_notes') or ''
-        examples_context = company_context.get('examples_context') or ''
-
-        # Build evidence from outline (these come from resume bullets)
-        intro_context = outline.get('introduction', '')
-        value_prop = outline.get('value_proposition', '')
-        alignment = outline.get('alignment', '')
-
-        user_prompt = f"""Write a cover letter for Benjamin Black applying to the {job_title} position at {company_name}.
-
-## TARGET TONE: {tone}
-
-## JOB REQUIREMENTS:
-- Key Skills Needed: {', '.join(skills[:10]) if skills else 'See priorities below'}
-- Core Priorities: {', '.join(priorities[:5]) if priorities else 'General alignment with role'}
-- Must-Have Capabilities: {', '.join(must_have[:5]) if must_have else 'See skills above'}
-
-## COMPANY CONTEXT:
-- Company: {company_name}
-- Known Initiatives: {initiatives if initiatives else 'Research and reference their specific mission'}
-- Culture Signals: {', '.join(culture) if culture else 'Professional environment'}
-
-## BENJAMIN'S RELEVANT BACKGROUND (use this to write authentic content):
-{value_prop}
-
-{alignment}
-
-## ADDITIONAL CONTEXT:
-{f'Referral: This application is via referral from {referral_name}. Mention this naturally in the opening.' if referral_name else ''}
-{f'User Notes: {context_notes}' if context_notes else ''}
-
-{f'## EXAMPLE APPROVED PARAGRAPHS (for style reference):{chr(10)}{examples_context}' if examples_context else ''}
+        # Job, company and outline context go in the cached system prefix
+        user_prompt = f"""Write a cover letter for Benjamin Black applying to the {job_title} position at {company_name}, using the cover letter context in the system prompt.
 
 ## INSTRUCTIONS:
 1. Write EXACTLY 250-275 words (not more!) across 4 tight paragraphs
@@ -263,9 +318,10 @@ Return ONLY the cover letter body (no greeting like "Dear..." or signature like
         message = self.client.messages.create(
             model=self.model,
             max_tokens=1500,
-            system=COVER_LETTER_SYSTEM_PROMPT,
+            system=_cover_letter_system_blocks(outline, job_context, company_context, tone),
             messages=[{"role": "user", "content": user_prompt}]
         )
+        _log_cache_usage(message, "generate_cover_letter")
 
         cover_letter = message.content[0].text.strip()
 
@@ -284,10 +340,14 @@ Return ONLY the cover letter body (no greeting like "Dear..." or signature like
         company_context: Dict,
         tone: str,
         user_name: str,
-        max_words: int = 300
+        max_words: int = 300,
+        outline: Optional[Dict] = None
     ) -> str:
         """
         Revise a cover letter based on critic feedback using Claude.
+
+        Sends the same system blocks as generate_cover_letter (pass the same
+        outline) so the style guide and job/company context are cache reads.
         """
         # Format issues for the prompt
         issues = critic_feedback.get('issues', [])
@@ -328,9 +388,10 @@ Return ONLY the revised cover letter body (no greeting or signature)."""
         message = self.client.messages.create(
             model=self.model,
             max_tokens=1500,
-            system=COVER_LETTER_SYSTEM_PROMPT,
+            system=_cover_letter_system_blocks(outline, job_context, company_context, tone),
             messages=[{"role": "user", "content": user_prompt}]
         )
+        _log_cache_usage(message, "revise_cover_letter")
 
         revised = message.content[0].text.strip()
 
@@ -379,7 +379,8 @@ class MockLLM(BaseLLM):
         company_context: Dict,
         tone: str,
         user_name: str,
-        max_words: int = 300
+        max_words: int = 300,
+        outline: Optional[Dict] = None
     ) -> str:
         """
         Revise a cover letter draft based on critic feedback.
@@ -395,6 +396,7 @@ class MockLLM(BaseLLM):
             tone: Target tone style
             user_name: User's full name for signature
             max_words: Target word count (advisory in mock)
+            outline: Outline the draft was generated from, if available
 
         Returns:
             Revised cover letter text
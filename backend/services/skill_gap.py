@@ -1056,7 +1056,7 @@ def save_skill_gap_analysis(
     Raises:
         ValueError: If job profile not found
     """
-    job_profile = db.query(JobProfile).filter(JobProfile.id == job_profile_id).first()
+    job_profile = db.get(JobProfile, job_profile_id)
     if not job_profile:
         raise ValueError(f"Job profile {job_profile_id} not found")
 
@@ -1094,7 +1094,7 @@ def get_cached_skill_gap_analysis(
     Returns:
         SkillGapResponse if cached and fresh, None otherwise
     """
-    job_profile = db.query(JobProfile).filter(JobProfile.id == job_profile_id).first()
+    job_profile = db.get(JobProfile, job_profile_id)
     if not job_profile or not job_profile.skill_gap_analysis:
         return None
 
@@ -1171,7 +1171,7 @@ async def analyze_skill_gap(
             return cached_analysis
 
     # Fetch job profile
-    job_profile = db.query(JobProfile).filter(JobProfile.id == job_profile_id).first()
+    job_profile = db.get(JobProfile, job_profile_id)
     if not job_profile:
         raise ValueError(f"Job profile {job_profile_id} not found")
 
@@ -1377,7 +1377,7 @@ async def get_cluster_analysis(
         ValueError: If job profile not found
     """
     # Fetch job profile
-    job_profile = db.query(JobProfile).filter(JobProfile.id == job_profile_id).first()
+    job_profile = db.get(JobProfile, job_profile_id)
     if not job_profile:
         raise ValueError(f"Job profile {job_profile_id} not found")
 
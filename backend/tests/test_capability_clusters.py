@@ -24,7 +24,12 @@ from schemas.capability import (
 from services.capability_ontology import (
     CAPABILITY_ONTOLOGY,
     get_cluster_names,
+    get_cluster_evidence_keywords,
+    get_ontology_cluster,
+    _build_cluster,
     get_clusters_by_keywords,
+    get_clusters_by_keywords_fast,
+    prepare_keyword_set,
     get_clusters_by_role_indicators,
     get_ontology_summary,
 )
@@ -190,11 +195,71 @@ class TestCapabilityOntology:
         assert len(matches) > 0
         assert "AI & Data Strategy" in matches or "Machine Learning Engineering" in matches
 
+    def test_get_clusters_by_keywords_top_k(self):
+        """Test that top_k returns the leading matches in ranked order."""
+        keywords = ["AI", "machine learning", "strategy", "AWS", "Kubernetes"]
+        matches = get_clusters_by_keywords(keywords)
+        assert get_clusters_by_keywords(keywords, top_k=2) == matches[:2]
+        assert get_clusters_by_keywords(keywords, top_k=0) == []
+
+    def test_prepare_keyword_set(self):
+        """Test tokenization keeps multi-word and punctuated keywords."""
+        keyword_set = prepare_keyword_set("Built CI/CD on Node.js with Machine Learning.")
+        assert "ci/cd" in keyword_set
+        assert "node.js" in keyword_set
+        assert "machine learning" in keyword_set
+        assert "learning." not in keyword_set
+
+    def test_get_clusters_by_keywords_fast_matches_list_api(self):
+        """Test the precomputed-set API ranks like the list API."""
+        keywords = ["AI", "Machine Learning", "Strategy", "AWS"]
+        keyword_set = frozenset(k.lower() for k in keywords)
+        assert get_clusters_by_keywords_fast(keyword_set) == get_clusters_by_keywords(keywords)
+
+    def test_get_cluster_evidence_keywords(self):
+        """Test lowercased evidence keyword lookup."""
+        keywords = get_cluster_evidence_keywords("Solution Architecture")
+        assert "aws" in keywords
+        assert "AWS" not in keywords
+        assert get_cluster_evidence_keywords("Unknown Cluster") == frozenset()
+
+    def test_get_ontology_cluster(self):
+        """Test the immutable runtime view mirrors the ontology dict."""
+        cluster = get_ontology_cluster("Solution Architecture")
+        data = CAPABILITY_ONTOLOGY["Solution Architecture"]
+        assert cluster.description == data["description"]
+        assert cluster.evidence_keywords == data["evidence_keywords"]
+        with pytest.raises(AttributeError):
+            cluster.description = "changed"
+        assert get_ontology_cluster("Unknown Cluster") is None
+
+    def test_build_cluster_rejects_malformed_entries(self):
+        """Test ontology entries are validated when the runtime view is built."""
+        valid = dict(CAPABILITY_ONTOLOGY["Solution Architecture"])
+        assert _build_cluster("Valid", valid).name == "Valid"
+        with pytest.raises(ValueError):
+            _build_cluster("No Keywords", {**valid, "evidence_keywords": []})
+        with pytest.raises(ValueError):
+            _build_cluster("Bad Importance", {**valid, "typical_importance": "urgent"})
+
     def test_get_clusters_by_role_indicators(self):
         """Test finding clusters by job title."""
         matches = get_clusters_by_role_indicators("AI Solutions Architect")
         assert len(matches) > 0
 
+    def test_get_clusters_by_role_indicators_word_boundaries(self):
+        """Test that indicators do not match inside longer words."""
+        # "staff" must not match "Staffing", "lead" must not match "Leadership"
+        assert "Solution Architecture" not in get_clusters_by_role_indicators("Staffing Coordinator")
+        assert get_clusters_by_role_indicators("AI Leadership Coach") == []
+
+    def test_get_clusters_by_role_indicators_overlapping(self):
+        """Test that overlapping indicators credit every matching cluster."""
+        # "ai architect" contains "architect", which belongs to another cluster
+        matches = get_clusters_by_role_indicators("AI Architect")
+        assert "AI & Data Strategy" in matches
+        assert "Solution Architecture" in matches
+
     def test_get_ontology_summary(self):
         """Test ontology summary generation."""
         summary = get_ontology_summary()
@@ -0,0 +1,91 @@
+"""
+Unit tests for ClaudeLLM cover letter prompt assembly.
+
+Covers the prompt caching layout without calling the Anthropic API:
+- generate and revise calls send an identical cacheable system prefix
+- only the draft and critic feedback vary in the revise user message
+"""
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from services.llm.claude_llm import ClaudeLLM
+
+
+OUTLINE = {
+    "introduction": "Intro",
+    "value_proposition": "Led enterprise data governance research for the CIO.",
+    "alignment": "Built metadata management programs at two asset managers.",
+    "call_to_action": "Discuss next steps",
+}
+JOB_CONTEXT = {
+    "title": "Data Governance Lead",
+    "priorities": ["Data governance frameworks"],
+    "skills": ["Collibra", "SQL"],
+    "must_have": ["Metadata management"],
+}
+COMPANY_CONTEXT = {"name": "Acme", "culture": ["collaborative"], "referral_name": None}
+
+
+def _llm():
+    llm = ClaudeLLM(api_key="test-key")
+    reply = SimpleNamespace(
+        content=[SimpleNamespace(text="Draft body.")],
+        usage=SimpleNamespace(
+            cache_read_input_tokens=0, cache_creation_input_tokens=0, input_tokens=0
+        ),
+    )
+    llm.client = MagicMock()
+    llm.client.messages.create.return_value = reply
+    return llm
+
+
+class TestCoverLetterPromptCaching:
+    """Tests for the cached system prefix shared by generate and revise."""
+
+    @pytest.mark.asyncio
+    async def test_generate_and_revise_share_cached_prefix(self):
+        """Should send identical system blocks, cached at the context block."""
+        llm = _llm()
+
+        await llm.generate_cover_letter(
+            OUTLINE, JOB_CONTEXT, COMPANY_CONTEXT, "formal_corporate", "Benjamin Black"
+        )
+        await llm.revise_cover_letter(
+            "Current draft text.",
+            {"issues": [], "improvement_suggestions": ["Be concrete"], "quality_score": 70},
+            JOB_CONTEXT,
+            COMPANY_CONTEXT,
+            "formal_corporate",
+            "Benjamin Black",
+            outline=OUTLINE,
+        )
+
+        generate_call, revise_call = llm.client.messages.create.call_args_list
+        system = generate_call.kwargs["system"]
+        assert revise_call.kwargs["system"] == system
+        assert [("cache_control" in block) for block in system] == [False, True]
+        assert "Metadata management" in system[1]["text"]
+        assert "Led enterprise data governance research" in system[1]["text"]
+
+    @pytest.mark.asyncio
+    async def test_revise_user_message_holds_only_dynamic_content(self):
+        """Should keep job and outline context out of the revise user message."""
+        llm = _llm()
+
+        await llm.revise_cover_letter(
+            "Current draft text.",
+            {"issues": [], "improvement_suggestions": [], "quality_score": 70},
+            JOB_CONTEXT,
+            COMPANY_CONTEXT,
+            "formal_corporate",
+            "Benjamin Black",
+            outline=OUTLINE,
+        )
+
+        [message] = llm.client.messages.create.call_args.kwargs["messages"]
+        assert "Current draft text." in message["content"]
+        assert "Metadata management" not in message["content"]
+        assert "Led enterprise data governance research" not in message["content"]
@@ -30,6 +30,7 @@ from services.company_enrichment import (
     validate_url,
     check_robots_txt,
     fetch_company_website_data,
+    fetch_company_website_data_async,
     infer_industry_and_size,
     _infer_metadata_heuristic,
     infer_culture_signals,
@@ -44,6 +45,15 @@ from services.company_enrichment import (
 )
 
 
+@pytest.fixture(autouse=True)
+def clear_website_cache():
+    """Keep cached website fetches from leaking between tests."""
+    from services import company_enrichment
+    company_enrichment._website_cache.clear()
+    yield
+    company_enrichment._website_cache.clear()
+
+
 class TestNormalizeCompanyName:
     """Tests for company name normalization."""
 
@@ -74,6 +84,7 @@ class TestNormalizeCompanyName:
         """Should handle companies with multiple suffixes."""
         assert normalize_company_name("Acme Holdings, Inc.") == "acme"
         assert normalize_company_name("Acme Group LLC") == "acme"
+        assert normalize_company_name("Acme Inc. Holdings") == "acme"
 
     def test_normalize_whitespace(self):
         """Should normalize whitespace."""
@@ -119,6 +130,28 @@ class TestIsPrivateIP:
         assert is_private_ip("127.0.0.1") is True
         assert is_private_ip("127.255.255.255") is True
 
+    @patch('services.company_enrichment.socket.gethostbyname', return_value="93.184.216.34")
+    def test_resolution_cached_per_host(self, mock_resolve):
+        """Should resolve each hostname once within the cache TTL."""
+        from services import company_enrichment
+        company_enrichment._dns_cache.clear()
+
+        assert is_private_ip("cached.example") is False
+        assert is_private_ip("CACHED.example") is False
+        assert mock_resolve.call_count == 1
+
+    @patch('services.company_enrichment.socket.gethostbyname')
+    def test_failed_resolution_cached(self, mock_resolve):
+        """Should cache failed lookups and keep blocking them."""
+        import socket
+        from services import company_enrichment
+        company_enrichment._dns_cache.clear()
+        mock_resolve.side_effect = socket.gaierror("not found")
+
+        assert is_private_ip("missing.example") is True
+        assert is_private_ip("missing.example") is True
+        assert mock_resolve.call_count == 1
+
 
 class TestValidateUrl:
     """Tests for URL validation."""
@@ -352,6 +385,16 @@ class TestInferAIMaturity:
         )
         assert maturity == "advanced"
 
+    @pytest.mark.asyncio
+    async def test_precomputed_lowercase_text(self):
+        """Should give the same result from a precomputed lowercased text."""
+        website = "Our MLOps team runs an Enterprise AI platform"
+        jd = "Hiring ML engineers"
+        combined_lower = f"{website} {jd}".lower()
+        assert await infer_ai_maturity(website, jd) == await infer_ai_maturity(
+            combined_lower=combined_lower
+        )
+
     @pytest.mark.asyncio
     async def test_empty_content(self):
         """Should return None for empty content."""
@@ -366,7 +409,7 @@ class TestEnrichCompanyProfile:
     def mock_db(self):
         """Create a mock database session."""
         db = MagicMock(spec=Session)
-        db.query.return_value.filter.return_value.first.return_value = None
+        db.query.return_value.filter.return_value.order_by.return_value.first.return_value = None
         db.query.return_value.all.return_value = []
         return db
 
@@ -392,7 +435,7 @@ class TestEnrichCompanyProfile:
             name="Acme Corp",
             industry=None,
         )
-        mock_db.query.return_value.filter.return_value.first.return_value = existing
+        mock_db.query.return_value.filter.return_value.order_by.return_value.first.return_value = existing
 
         profile = await enrich_company_profile(
             company_name="Acme Corp",
@@ -405,23 +448,29 @@ class TestEnrichCompanyProfile:
         mock_db.commit.assert_called_once()
 
     @pytest.mark.asyncio
-    async def test_deduplication_by_normalized_name(self, mock_db):
-        """Should find existing profile by normalized name."""
-        existing = CompanyProfile(
-            id=1,
-            name="Acme, Inc.",
-        )
-        mock_db.query.return_value.filter.return_value.first.return_value = None
-        mock_db.query.return_value.all.return_value = [existing]
+    async def test_deduplication_uses_normalized_name_column(self, mock_db):
+        """Should reuse the profile found by the normalized_name lookup."""
+        existing = CompanyProfile(id=1, name="Acme, Inc.")
+        mock_db.query.return_value.filter.return_value.order_by.return_value.first.return_value = existing
 
         profile = await enrich_company_profile(
             company_name="Acme Corporation",
             db=mock_db,
         )
 
-        # Should find existing by normalized name match
-        # (acme inc == acme corporation after normalization)
-        mock_db.commit.assert_called()
+        assert profile is existing
+        assert existing.normalized_name == "acme"
+        mock_db.add.assert_not_called()
+        # Exact and normalized lookups share a single query
+        assert mock_db.query.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_new_profile_stores_normalized_name(self, mock_db):
+        """Should persist the dedup key on newly created profiles."""
+        await enrich_company_profile(company_name="Acme, Inc.", db=mock_db)
+
+        created = mock_db.add.call_args[0][0]
+        assert created.normalized_name == "acme"
 
     @pytest.mark.asyncio
     async def test_requires_company_name(self, mock_db):
@@ -647,7 +696,60 @@ class TestWebsiteFetching:
         result = fetch_company_website_data("http://localhost:8080")
         assert result["error"] is not None
 
-    @patch('services.company_enrichment.requests.get')
+    @pytest.mark.asyncio
+    async def test_fetch_async_blocks_localhost(self):
+        """Async wrapper should apply the same validation."""
+        result = await fetch_company_website_data_async("http://localhost:8080")
+        assert result["error"] is not None
+
+    @pytest.mark.asyncio
+    async def test_fetch_async_honors_max_concurrent_fetches(self):
+        """Should bound in-flight fetches by the per-call config."""
+        import asyncio
+        import threading
+        import time
+
+        lock = threading.Lock()
+        in_flight = peak = 0
+
+        def fake_fetch(website_url, config):
+            nonlocal in_flight, peak
+            with lock:
+                in_flight += 1
+                peak = max(peak, in_flight)
+            time.sleep(0.02)
+            with lock:
+                in_flight -= 1
+            return {"error": None}
+
+        config = {"max_concurrent_fetches": 1}
+        with patch('services.company_enrichment.fetch_company_website_data', fake_fetch):
+            await asyncio.gather(*(
+                fetch_company_website_data_async(f"https://{i}.example", config)
+                for i in range(3)
+            ))
+        assert peak == 1
+
+    def test_fetch_async_limit_per_event_loop(self):
+        """Should not reuse a semaphore bound to an earlier event loop."""
+        import asyncio
+        import time
+
+        def fake_fetch(website_url, config):
+            time.sleep(0.01)
+            return {"error": None}
+
+        async def contended_fetches():
+            return await asyncio.gather(*(
+                fetch_company_website_data_async(f"https://{i}.example", {"max_concurrent_fetches": 1})
+                for i in range(2)
+            ))
+
+        with patch('services.company_enrichment.fetch_company_website_data', fake_fetch):
+            for _ in range(2):
+                assert asyncio.run(contended_fetches()) == [{"error": None}] * 2
+
+    @patch('services.company_enrichment._session.get')
     def test_fetch_timeout_handling(self, mock_get):
         """Should handle timeouts gracefully."""
         import requests
@@ -656,7 +758,7 @@ class TestWebsiteFetching:
         result = fetch_company_website_data("https://example.com")
         assert result["error"] == "Request timeout"
 
-    @patch('services.company_enrichment.requests.get')
+    @patch('services.company_enrichment._session.get')
     @patch('services.company_enrichment.check_robots_txt')
     def test_fetch_success(self, mock_robots, mock_get):
         """Should successfully fetch and parse website."""
@@ -664,8 +766,11 @@ class TestWebsiteFetching:
 
         mock_response = MagicMock()
         mock_response.headers = {'content-length': '1000'}
-        mock_response.iter_content.return_value = [b'<html><head><meta name="description" content="Test company"></head><body>Welcome</body></html>']
+        html = b'<html><head><meta name="description" content="Test company"></head><body>Welcome</body></html>'
+        mock_response.content = html
+        mock_response.iter_content.return_value = [html]
         mock_response.raise_for_status = MagicMock()
+        mock_response.is_redirect = False
         mock_get.return_value = mock_response
 
         result = fetch_company_website_data("https://example.com")
@@ -673,6 +778,223 @@ class TestWebsiteFetching:
         assert result["meta_description"] == "Test company"
 
 
+def _redirect_response(location):
+    response = MagicMock()
+    response.is_redirect = True
+    response.headers = {'location': location}
+    return response
+
+
+def _html_response(url, html):
+    response = MagicMock()
+    response.is_redirect = False
+    response.url = url
+    response.headers = {'content-length': str(len(html))}
+    response.content = html
+    response.iter_content.return_value = [html]
+    return response
+
+
+@patch('services.company_enrichment.check_robots_txt', return_value=True)
+class TestRedirectValidation:
+    """Tests for per-hop redirect validation (SSRF protection)."""
+
+    @patch('services.company_enrichment._session.get')
+    @patch('services.company_enrichment.validate_url')
+    def test_redirect_to_private_ip_blocked(self, mock_validate, mock_get, _robots):
+        """Should not follow a redirect to a private address."""
+        mock_validate.side_effect = [(True, ""), (False, "Private IP addresses are not allowed")]
+        mock_get.return_value = _redirect_response("http://169.254.169.254/latest/meta-data")
+
+        result = fetch_company_website_data("https://acme.example")
+
+        assert "blocked" in result["error"]
+        assert mock_get.call_count == 1
+        assert mock_get.call_args.kwargs["allow_redirects"] is False
+
+    @patch('services.company_enrichment._session.get')
+    @patch('services.company_enrichment.validate_url', return_value=(True, ""))
+    def test_relative_redirect_followed(self, mock_validate, mock_get, _robots):
+        """Should resolve relative Location headers against the current URL."""
+        html = b'<html><body>Welcome</body></html>'
+        mock_get.side_effect = [
+            _redirect_response("/home"),
+            _html_response("https://acme.example/home", html),
+        ]
+
+        result = fetch_company_website_data("https://acme.example/")
+
+        assert result["error"] is None
+        assert mock_get.call_args_list[1].args[0] == "https://acme.example/home"
+        mock_validate.assert_called_with("https://acme.example/home")
+
+    @patch('services.company_enrichment._session.get')
+    @patch('services.company_enrichment.validate_url', return_value=(True, ""))
+    def test_redirect_loop_stops(self, mock_validate, mock_get, _robots):
+        """Should give up after the redirect limit."""
+        mock_get.return_value = _redirect_response("/again")
+
+        result = fetch_company_website_data("https://acme.example/")
+
+        assert result["error"] is not None
+        assert mock_get.call_count == 6
+
+    @patch('services.company_enrichment._session.get')
+    @patch('services.company_enrichment.validate_url', return_value=(True, ""))
+    def test_scheme_relative_about_link(self, mock_validate, mock_get, _robots):
+        """Should resolve //host/path about links to that host."""
+        home = b'<html><body><a href="//other.example/about">About</a></body></html>'
+        about = b'<html><body>Our story</body></html>'
+        mock_get.side_effect = [
+            _html_response("https://acme.example/", home),
+            _html_response("https://other.example/about", about),
+        ]
+
+        result = fetch_company_website_data("https://acme.example/")
+
+        assert mock_get.call_args_list[1].args[0] == "https://other.example/about"
+        assert result["about_text"] == "Our story"
+
+    @patch('services.company_enrichment._session.get')
+    @patch('services.company_enrichment.validate_url', return_value=(True, ""))
+    def test_about_fetch_skipped_for_rich_homepage(self, mock_validate, mock_get, _robots):
+        """Should not fetch the about page when the homepage has enough text."""
+        home = (
+            '<html><body><p>' + 'Acme builds software. ' * 100 + '</p>'
+            '<a href="/About-Us">About</a></body></html>'
+        ).encode()
+        mock_get.return_value = _html_response("https://acme.example/", home)
+
+        result = fetch_company_website_data("https://acme.example/")
+
+        assert mock_get.call_count == 1
+        assert result["about_text"] == ""
+
+    @patch('services.company_enrichment._session.get')
+    @patch('services.company_enrichment.validate_url', return_value=(True, ""))
+    def test_about_link_match_is_case_insensitive(self, mock_validate, mock_get, _robots):
+        """Should pick the first link that looks like an about page."""
+        home = b'<html><body><a href="/careers">Jobs</a><a href="/Who-We-Are">Us</a></body></html>'
+        about = b'<html><body>Our story</body></html>'
+        mock_get.side_effect = [
+            _html_response("https://acme.example/", home),
+            _html_response("https://acme.example/Who-We-Are", about),
+        ]
+
+        fetch_company_website_data("https://acme.example/")
+
+        assert mock_get.call_args_list[1].args[0] == "https://acme.example/Who-We-Are"
+
+
+@patch('services.company_enrichment.check_robots_txt', return_value=True)
+@patch('services.company_enrichment.validate_url', return_value=(True, ""))
+class TestWebsiteCache:
+    """Tests for caching of fetched website data."""
+
+    @patch('services.company_enrichment._session.get')
+    def test_successful_fetch_cached(self, mock_get, _validate, _robots):
+        """Should serve repeat fetches of the same URL from cache."""
+        mock_get.return_value = _html_response("https://acme.example/", b'<p>Welcome</p>')
+
+        first = fetch_company_website_data("https://acme.example/")
+        first["homepage_text"] = "mutated by caller"
+        second = fetch_company_website_data("https://acme.example/")
+
+        assert mock_get.call_count == 1
+        assert second["homepage_text"] == "Welcome"
+
+    @patch('services.company_enrichment._session.get')
+    def test_force_refresh_bypasses_cache(self, mock_get, _validate, _robots):
+        """Should refetch when force_refresh is set."""
+        mock_get.return_value = _html_response("https://acme.example/", b'<p>Welcome</p>')
+
+        fetch_company_website_data("https://acme.example/")
+        fetch_company_website_data("https://acme.example/", {"force_refresh": True})
+
+        assert mock_get.call_count == 2
+
+    @patch('services.company_enrichment._session.get')
+    def test_cache_keyed_by_fetch_config(self, mock_get, _validate, _robots):
+        """Should not serve a result fetched under different fetch settings."""
+        mock_get.return_value = _html_response("https://acme.example/", b'<p>Welcome</p>')
+
+        fetch_company_website_data("https://acme.example/")
+        fetch_company_website_data("https://acme.example/", {"max_response_size": 1024})
+        fetch_company_website_data("https://acme.example/", {"user_agent": "Other/1.0"})
+        fetch_company_website_data("https://acme.example/", {"max_response_size": 1024})
+
+        assert mock_get.call_count == 3
+
+    @patch('services.company_enrichment._session.get')
+    def test_identical_pages_parsed_once(self, mock_get, _validate, _robots):
+        """Should reuse the parse for identical bytes served by different URLs."""
+        from bs4 import BeautifulSoup
+        from services import company_enrichment
+        company_enrichment._parse_cache.clear()
+        html = b'<html><head><meta name="description" content="Mirror"></head><body>Same page</body></html>'
+        mock_get.side_effect = [
+            _html_response("https://acme.example/", html),
+            _html_response("https://www.acme.example/", html),
+        ]
+
+        with patch('services.company_enrichment.BeautifulSoup', wraps=BeautifulSoup) as mock_soup:
+            first = fetch_company_website_data("https://acme.example/")
+            second = fetch_company_website_data("https://www.acme.example/")
+
+        assert mock_soup.call_count == 1
+        assert first["meta_description"] == second["meta_description"] == "Mirror"
+        assert second["homepage_text"] == "Same page"
+
+    @patch('services.company_enrichment._session.get')
+    def test_errors_not_cached(self, mock_get, _validate, _robots):
+        """Should retry URLs whose previous fetch failed."""
+        import requests
+        mock_get.side_effect = requests.Timeout("timed out")
+
+        fetch_company_website_data("https://acme.example/")
+        fetch_company_website_data("https://acme.example/")
+
+        assert mock_get.call_count == 2
+
+
+class TestBoundedText:
+    """Tests for early-exit page text extraction."""
+
+    def test_matches_truncated_get_text(self):
+        """Should equal get_text(' ', strip=True) cut to the limit."""
+        from bs4 import BeautifulSoup
+        from services.company_enrichment import _bounded_text
+
+        html = "<html><body>" + "<p> Acme <b>builds</b>\n software </p>" * 500 + "</body></html>"
+        soup = BeautifulSoup(html, "html.parser")
+        for limit in (1, 5, 6, 2000):
+            assert _bounded_text(soup, limit) == soup.get_text(separator=' ', strip=True)[:limit]
+
+
+class TestRobotsTxtCache:
+    """Tests for per-host robots.txt caching."""
+
+    def setup_method(self):
+        from services import company_enrichment
+        company_enrichment._robots_cache.clear()
+
+    @patch('services.company_enrichment.RobotFileParser.read', autospec=True)
+    def test_robots_fetched_once_per_host(self, mock_read):
+        """Should reuse the parsed robots.txt for the same host."""
+        mock_read.side_effect = lambda rp: rp.parse(["User-agent: *", "Disallow: /private"])
+        assert check_robots_txt("https://acme.example/") is True
+        assert check_robots_txt("https://acme.example/private/x") is False
+        assert mock_read.call_count == 1
+
+    @patch('services.company_enrichment.RobotFileParser.read')
+    def test_robots_error_treated_as_allowed(self, mock_read):
+        """Should allow fetching and cache the failure briefly."""
+        mock_read.side_effect = OSError("unreachable")
+        assert check_robots_txt("https://down.example/") is True
+        assert check_robots_txt("https://down.example/") is True
+        assert mock_read.call_count == 1
+
+
 class TestTaxonomyValues:
     """Tests to verify taxonomy values are defined correctly."""
 
@@ -706,7 +1028,7 @@ class TestIntegrationScenarios:
     def mock_db(self):
         """Create a mock database session."""
         db = MagicMock(spec=Session)
-        db.query.return_value.filter.return_value.first.return_value = None
+        db.query.return_value.filter.return_value.order_by.return_value.first.return_value = None
         db.query.return_value.all.return_value = []
         return db
 
@@ -0,0 +1,254 @@
+"""
+Unit tests for the deterministic cover letter checks.
+
+Covers the pure-Python helpers in services/cover_letter.py that run on every
+generated letter:
+- Banned phrase and em-dash detection (word boundaries, severity, sections)
+- ATS keyword coverage (phrase boundaries, synonym groups)
+- Requirement coverage and evidence sentences
+- smart_truncate boundary selection
+- Tone compatibility lookup
+- Concurrent quality check aggregation
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from services.cover_letter import (
+    analyze_ats_keyword_coverage,
+    analyze_requirement_coverage,
+    check_banned_phrases,
+    check_em_dashes,
+    get_tone_compatibility,
+    run_quality_checks,
+    smart_truncate,
+)
+from services.llm.mock_llm import MockLLM
+
+
+LETTER = (
+    "Dear Hiring Manager,\n"
+    "\n"
+    "I lead data platform work.\n"
+    "Our team shipped a passionate redesign.\n"
+    "It cut costs in half.\n"
+    "We measured every result.\n"
+    "\n"
+    "Sincerely,\n"
+    "Jane Doe\n"
+    "jane@example.com"
+)
+
+
+class TestCheckBannedPhrases:
+    """Tests for banned phrase detection."""
+
+    def test_clean_text_passes(self):
+        """Should report no violations for clean text."""
+        result = check_banned_phrases("I built a forecasting model used by 40 analysts.")
+        assert result.violations_found == 0
+        assert result.overall_severity == "none"
+        assert result.passed is True
+
+    def test_phrase_sections(self):
+        """Should attribute hits to greeting, body, or closing by line."""
+        result = check_banned_phrases(LETTER, company_name="Acme")
+        found = {(v.phrase, v.severity, v.section) for v in result.violations}
+        assert ("dear hiring manager", "major", "greeting") in found
+        assert ("passionate", "major", "body") in found
+        assert result.passed is False
+
+    def test_dear_hiring_manager_downgraded_without_company(self):
+        """Should treat the generic greeting as minor when no company is known."""
+        result = check_banned_phrases("Dear Hiring Manager,\nThanks.")
+        assert [v.severity for v in result.violations] == ["minor"]
+        assert result.passed is True
+
+    def test_word_boundaries(self):
+        """Should not flag banned words embedded in longer words."""
+        result = check_banned_phrases("The shop is data-driven and leverages nothing.")
+        phrases = [v.phrase for v in result.violations]
+        assert "driven" in phrases  # hyphen is a boundary
+        assert "leverage" not in phrases
+
+    def test_case_insensitive_and_repeated(self):
+        """Should match regardless of case and report every occurrence."""
+        result = check_banned_phrases("SYNERGY here.\nSynergy there.")
+        assert [v.phrase for v in result.violations] == ["synergy", "synergy"]
+        assert result.overall_severity == "minor"
+
+    def test_em_dash_is_critical(self):
+        """Should include em-dash violations in the overall check."""
+        result = check_banned_phrases("Good results—fast.")
+        assert result.overall_severity == "critical"
+        assert len(check_em_dashes("a—b—c")) == 2
+
+    def test_em_dash_sections(self):
+        """Should attribute em-dashes to the line they appear on."""
+        text = LETTER.replace("It cut", "It—cut").replace("Sincerely", "Sincerely—")
+        sections = [v.section for v in check_em_dashes(text)]
+        assert sections == ["body", "closing"]
+
+
+def _job(extracted_skills=None, must_have=None, priorities=None, tone_style=None):
+    return SimpleNamespace(
+        extracted_skills=extracted_skills,
+        must_have_capabilities=must_have,
+        core_priorities=priorities,
+        tone_style=tone_style,
+    )
+
+
+class TestAnalyzeATSKeywordCoverage:
+    """Tests for ATS keyword coverage analysis."""
+
+    def test_no_keywords(self):
+        """Should fail coverage when the job has no keywords."""
+        result = analyze_ats_keyword_coverage("Anything", _job())
+        assert result.total_keywords == 0
+        assert result.coverage_adequate is False
+
+    def test_direct_match_respects_boundaries(self):
+        """Should match whole phrases case-insensitively, not substrings."""
+        result = analyze_ats_keyword_coverage(
+            "I shipped PYTHON services and Javanese poetry.",
+            _job(extracted_skills=["Python", "Java"]),
+        )
+        assert result.covered_keywords == ["Python"]
+
+    def test_synonym_counts_as_covered(self):
+        """Should credit a keyword when any synonym in its group appears."""
+        result = analyze_ats_keyword_coverage(
+            "Built dashboards in ReactJS.",
+            _job(extracted_skills=["React"]),
+        )
+        assert result.covered_keywords == ["React"]
+
+    def test_missing_critical_from_must_haves(self):
+        """Should report uncovered must-have capabilities as critical."""
+        result = analyze_ats_keyword_coverage(
+            "I write Python.",
+            _job(extracted_skills=["Python"], must_have=["Kubernetes"]),
+        )
+        assert result.missing_critical_keywords == ["Kubernetes"]
+        assert result.coverage_percentage == 50.0
+
+
+class TestAnalyzeRequirementCoverage:
+    """Tests for top-requirement coverage and evidence extraction."""
+
+    def test_evidence_is_first_matching_sentence(self):
+        """Should quote the first sentence mentioning the requirement."""
+        text = "I like teams. Our Data\nPlatform served 40 teams. Data again."
+        [result] = analyze_requirement_coverage(text, _job(priorities=["Data platform"]))
+        assert result.covered is True
+        assert result.evidence == "Our Data Platform served 40 teams..."
+
+    def test_word_overlap_without_phrase(self):
+        """Should cover a requirement when most significant words appear."""
+        text = "I partnered with every stakeholder on analytics."
+        [result] = analyze_requirement_coverage(
+            text, _job(priorities=["Stakeholder analytics management"])
+        )
+        assert result.covered is True
+        assert result.evidence.startswith("I partnered")
+
+    def test_evidence_with_length_changing_lowercase(self):
+        """Should quote the right sentence when lower() changes the text length."""
+        text = "İlker and İpek built it. Our data platform served 40 teams. Done."
+        [result] = analyze_requirement_coverage(text, _job(priorities=["Data platform"]))
+        assert len(text.lower()) != len(text)
+        assert result.evidence == "Our data platform served 40 teams..."
+
+    def test_uncovered_has_no_evidence(self):
+        """Should leave evidence empty for requirements the letter misses."""
+        [result] = analyze_requirement_coverage("Nothing relevant.", _job(must_have=["Kubernetes"]))
+        assert result.covered is False
+        assert result.evidence is None
+
+
+class TestSmartTruncate:
+    """Tests for boundary-aware truncation."""
+
+    def test_short_and_empty_text_unchanged(self):
+        """Should return short text as-is and empty text as ''."""
+        assert smart_truncate("Built a model.", 100) == "Built a model."
+        assert smart_truncate(None) == ""
+
+    def test_prefers_sentence_boundary(self):
+        """Should cut at the last sentence end within the limit."""
+        text = "Led the data platform rebuild. Cut costs by half across all regions"
+        assert smart_truncate(text, 50) == "Led the data platform rebuild."
+
+    def test_avoids_bad_endings(self):
+        """Should not end on an article or preposition."""
+        text = "Partnered closely with leaders across the organization to define strategy"
+        result = smart_truncate(text, 45)
+        assert result.split()[-1].lower() not in {"the", "to", "with"}
+        assert text.startswith(result)
+
+    def test_repeat_calls_are_cached(self):
+        """Should serve repeated arguments from the cache."""
+        smart_truncate.cache_clear()
+        text = "Owned forecasting for every product line across twelve markets worldwide"
+        first = smart_truncate(text, 40)
+        assert smart_truncate(text, 40) == first
+        assert smart_truncate.cache_info().hits == 1
+
+
+class TestToneCompatibility:
+    """Tests for the tone compatibility matrix lookup."""
+
+    def test_exact_match(self):
+        """Should score identical tones as fully compatible."""
+        assert get_tone_compatibility("startup_casual", "startup_casual") == 1.0
+
+    def test_symmetric(self):
+        """Should score a pair the same in either order."""
+        assert get_tone_compatibility("formal_corporate", "technical_precise") == 0.85
+        assert get_tone_compatibility("technical_precise", "formal_corporate") == 0.85
+
+    def test_unknown_pair_default(self):
+        """Should fall back to the mismatch default for unlisted pairs."""
+        assert get_tone_compatibility("startup_casual", "academic_research") == 0.35
+        assert get_tone_compatibility("formal_corporate", "pirate") == 0.35
+
+
+class TestRunQualityChecks:
+    """Tests for the concurrent quality check aggregator."""
+
+    @pytest.mark.asyncio
+    async def test_matches_individual_checks(self):
+        """Should return the same results as running each check on its own."""
+        job = _job(extracted_skills=["Python"], tone_style="formal_corporate")
+        llm = MockLLM()
+
+        banned, tone, ats = await run_quality_checks(LETTER, job, "Acme", llm)
+
+        assert banned == check_banned_phrases(LETTER, "Acme")
+        assert ats == analyze_ats_keyword_coverage(LETTER, job)
+        assert tone.target_tone == "formal_corporate"
+        assert tone.detected_tone == await llm.infer_tone(LETTER)
+
+    @pytest.mark.asyncio
+    async def test_ats_worker_gets_field_snapshot(self, monkeypatch):
+        """Should hand the ATS worker plain fields, not the job profile itself."""
+        import services.cover_letter as cover_letter
+
+        seen = []
+        real = cover_letter.analyze_ats_keyword_coverage
+
+        def spy(text, job_profile, text_lower=None):
+            seen.append(job_profile)
+            return real(text, job_profile, text_lower)
+
+        monkeypatch.setattr(cover_letter, "analyze_ats_keyword_coverage", spy)
+        job = _job(extracted_skills=["Python"], must_have=["SQL"], tone_style="formal_corporate")
+
+        await run_quality_checks(LETTER, job, None, MockLLM())
+
+        [snapshot] = seen
+        assert snapshot is not job
+        assert snapshot.extracted_skills == ["Python"]
+        assert snapshot.must_have_capabilities == ["SQL"]
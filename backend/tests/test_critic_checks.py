@@ -0,0 +1,109 @@
+"""
+Unit tests for the critic's deterministic text checks.
+
+Covers the helpers in services/critic.py that run on every critic pass:
+- Banned phrase detection (word boundaries, severity mapping, snippets)
+- Verb strength and filler word lexicon checks
+- Generic opening/closing detection in the structure check
+"""
+
+from types import SimpleNamespace
+
+from services.critic import (
+    check_banned_phrases,
+    check_cover_letter_structure_enhanced,
+    check_filler_words,
+    check_verb_strength,
+)
+
+
+class TestCriticBannedPhrases:
+    """Tests for critic banned phrase detection."""
+
+    def test_empty_text(self):
+        """Should return no issues for empty or missing text."""
+        assert check_banned_phrases("") == []
+        assert check_banned_phrases(None) == []
+
+    def test_clean_text(self):
+        """Should report nothing when no banned phrase occurs."""
+        assert check_banned_phrases("I built a forecasting model used by 40 analysts.") == []
+
+    def test_severity_mapping_and_fix(self):
+        """Should map phrase severity to critic severity and attach the fix."""
+        [issue] = check_banned_phrases("To whom it may concern, hello.", context="cover_letter")
+        assert issue.issue_type == "banned_phrase"
+        assert issue.severity == "error"
+        assert issue.section == "cover_letter"
+        assert issue.recommended_fix.startswith("Address the hiring team")
+
+    def test_word_boundaries_and_case(self):
+        """Should match case-insensitively but not inside longer words."""
+        issues = check_banned_phrases("A SYNERGY play. Synergies aside, synergy again.")
+        assert [i.message for i in issues] == ["Banned phrase detected: 'synergy'"] * 2
+
+    def test_dear_hiring_manager_depends_on_company(self):
+        """Should downgrade the generic greeting when no company is known."""
+        text = "Dear Hiring Manager, thanks."
+        assert [i.severity for i in check_banned_phrases(text)] == ["info"]
+        assert [i.severity for i in check_banned_phrases(text, company_name="Acme")] == ["warning"]
+
+    def test_snippet_context(self):
+        """Should quote the match with up to 20 characters of context."""
+        text = "Over the last ten years I have been a team player in every role I held."
+        [issue] = check_banned_phrases(text)
+        assert issue.original_text == "...years I have been a team player in every role I hel..."
+
+
+class TestStyleLexiconChecks:
+    """Tests for verb strength and filler word detection."""
+
+    def test_verb_counts_respect_word_boundaries(self):
+        """Should count whole-word verbs only, case-insensitively."""
+        score, weak_rate, issues = check_verb_strength(
+            "I LED the rebuild and built the team. Misled nobody. I helped."
+        )
+        assert weak_rate == 1 / 3
+        assert [i.message for i in issues] == ["Weak verb detected: 'helped'"]
+        assert score < 100
+
+    def test_multi_word_weak_verb(self):
+        """Should flag multi-word weak verb phrases."""
+        _, _, issues = check_verb_strength("I was responsible for the data platform.")
+        messages = {i.message for i in issues}
+        assert "Weak verb detected: 'was responsible for'" in messages
+
+    def test_filler_words_aggregated(self):
+        """Should report one issue per filler word, most frequent first."""
+        issues = check_filler_words("It was really, really fast and very kind of good.")
+        assert issues[0].message == "Filler word 'really' used 2 time(s)"
+        assert issues[0].original_text == "It was really, really fast and ve..."
+        assert len(issues) == 3
+
+
+def _structure(draft):
+    job = SimpleNamespace(core_priorities=None, must_have_capabilities=None)
+    _, _, details = check_cover_letter_structure_enhanced({"draft_cover_letter": draft}, job)
+    return details
+
+
+class TestOpeningClosingPatterns:
+    """Tests for generic opening and closing detection."""
+
+    def test_generic_opening_and_closing(self):
+        """Should flag a generic intro and a passive closing."""
+        details = _structure(
+            "I am writing to apply for the role.\n\n"
+            "Thank you for your consideration."
+        )
+        assert details["has_value_opening"] is False
+        assert details["has_impact_closing"] is False
+
+    def test_opening_pattern_is_anchored(self):
+        """Should only flag generic intros at the start of the opening."""
+        details = _structure(
+            "At Acme I led governance. I am writing to share results.\n\n"
+            "I would welcome the chance to discuss Acme's roadmap."
+        )
+        assert details["has_value_opening"] is True
+        assert details["has_impact_closing"] is True